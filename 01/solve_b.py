@@ -1,18 +1,14 @@
 #!/usr/bin/env python3
 
-import sys
+from aoc import verbosity
 
+from sonar import solve
 
-def main() -> None:
-    numbers = [int(line.strip()) for line in sys.stdin.readlines()]
-
-    # When comparing two consecutive sliding windows it is enough to compare
-    # the unique elements between the windows
-    pairs = list(zip(numbers[:-3], numbers[3:]))
-    result = sum(1 for a, b in pairs if a < b)
 
-    print(result)
+def main() -> None:
+    print(solve(window=3))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
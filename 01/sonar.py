@@ -0,0 +1,170 @@
+"""Count increasing sonar sweeps.
+
+Two consecutive sliding windows of N depths share N - 1 of them, so comparing
+their sums is the same as comparing the two depths N apart. A window of 1 is
+part A, 3 is part B.
+
+Big inputs in a file are memory-mapped and compared with numpy a chunk at a
+time, anything else is streamed in constant memory. Compare the two with:
+
+    PYTHONPATH=. python3 01/sonar.py 100000000
+"""
+
+import itertools
+import operator
+import os
+import sys
+import tempfile
+import time
+import unittest
+from typing import Iterable
+from typing import Iterator
+
+from aoc import loader
+
+CHUNK_BYTES = loader.SEPARATED_CHUNK_BYTES
+"""Bytes of input parsed into an array at a time."""
+
+NUMPY_MIN_BYTES = 1024 * 1024
+"""Smaller inputs are streamed, they are done before numpy is imported."""
+
+
+def depths(stream=None) -> Iterator[int]:
+    """Return iterator over the depths in stream, one per line, by default stdin.
+
+    Binary streams are read as is, int() parses the bytes without decoding.
+    """
+    if stream is None:
+        stream = getattr(sys.stdin, "buffer", sys.stdin)
+
+    return map(int, stream)
+
+
+def count_increases(readings: Iterable[int], window: int = 1) -> int:
+    """Return how many sliding windows of size window have a larger sum than the previous.
+
+    Only the window readings between the compared ones are kept in memory.
+    """
+    current, ahead = itertools.tee(readings)
+
+    return sum(map(operator.lt, current, itertools.islice(ahead, window, None)))
+
+
+def count_increases_array(readings, window: int = 1) -> int:
+    """Return count_increases() for a numpy array of readings."""
+    return int((readings[window:] > readings[:-window]).sum())
+
+
+def count_increases_mapped(buffer: loader.Buffer, window: int = 1) -> int:
+    """Return count_increases() for the depths in buffer, parsed CHUNK_BYTES at a time.
+
+    The last window readings of a chunk are carried over to the next one.
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    count = 0
+    tail = numpy.zeros(0, dtype=numpy.int64)
+    start = 0
+    while start < len(buffer):
+        stop = len(buffer)
+        if start + CHUNK_BYTES < stop:
+            # Only split after the end of a line
+            stop = buffer.rfind(b"\n", start, start + CHUNK_BYTES) + 1 or stop
+
+        readings = numpy.concatenate((tail, loader.separated_integers(buffer[start:stop])))
+        count += count_increases_array(readings, window)
+        tail = readings[-window:]
+        start = stop
+
+    return count
+
+
+def solve(window: int) -> int:
+    """Return the number of increasing windows in the depths on stdin."""
+    try:
+        buffer = loader.map_file(sys.stdin.fileno())
+
+    except (AttributeError, OSError, ValueError):  # i.e. io.StringIO has no file number
+        buffer = None
+
+    if buffer is None or len(buffer) < NUMPY_MIN_BYTES:
+        return count_increases(depths(), window)
+
+    try:
+        return count_increases_mapped(buffer, window)
+
+    except ImportError:
+        return count_increases(depths(), window)
+
+
+def benchmark(count: int) -> None:
+    """Print the time of both implementations on count random depths."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    random = numpy.random.default_rng(2021)
+    depths_data = numpy.cumsum(random.integers(-10, 11, count)) + 10 * count
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as input_file:
+        numpy.savetxt(input_file, depths_data, fmt="%d")
+        input_file.flush()
+        print(f"{count} depths, {os.path.getsize(input_file.name) / 2**20 : .0f} MiB")
+
+        for window in (1, 3):
+            with open(input_file.name, "rb") as stream:
+                start = time.perf_counter()
+                streamed = count_increases(depths(stream), window)
+                streamed_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            vectorised = count_increases_mapped(loader.read_input(input_file.name), window)
+            vectorised_seconds = time.perf_counter() - start
+
+            assert streamed == vectorised, (streamed, vectorised)
+            print(
+                f"window {window}: {streamed} increases | "
+                f"streamed {streamed_seconds : >6.2f} s | numpy {vectorised_seconds : >6.2f} s"
+            )
+
+
+class TestCountIncreases(unittest.TestCase):
+    EXAMPLE = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+
+    def test_window_of_1_should_count_increasing_depths(self):
+        # Given
+        readings = iter(self.EXAMPLE)
+
+        # When
+        result = count_increases(readings, window=1)
+
+        # Then
+        self.assertEqual(7, result)
+
+    def test_window_of_3_should_count_increasing_sums(self):
+        # Given
+        readings = iter(self.EXAMPLE)
+
+        # When
+        result = count_increases(readings, window=3)
+
+        # Then
+        self.assertEqual(5, result)
+
+    def test_chunks_should_give_same_count_as_whole_array(self):
+        # Given
+        global CHUNK_BYTES  # pylint: disable=global-statement
+        buffer = "\n".join(map(str, self.EXAMPLE)).encode()
+        chunk_bytes, CHUNK_BYTES = CHUNK_BYTES, 10
+
+        # When
+        try:
+            result = count_increases_mapped(buffer, window=3)
+
+        finally:
+            CHUNK_BYTES = chunk_bytes
+
+        # Then
+        self.assertEqual(5, result)
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,247 @@
+"""Follow the planned course of the submarine.
+
+A stretch of commands sums up to a Course: how far forward it goes, how much
+the aim changes and how deep it goes if the aim is 0 at the start. Starting
+with a different aim only adds aim * forward to the depth, so two courses
+add up to the course of both stretches, in order.
+
+Big inputs in a file are memory-mapped and tokenised in bulk with numpy, a
+chunk at a time: one opcode per line (the first character) and one value.
+Then the aim is the cumulative sum of the ups and downs, and the depth is
+the dot product of the aim with the forward values.
+
+Since courses add up in order, the file can also be split into byte ranges
+of whole lines, each range followed by its own worker process and the
+courses added up afterwards.
+"""
+
+import concurrent.futures
+import os
+import sys
+import unittest
+from dataclasses import dataclass
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from aoc import loader
+
+CHUNK_BYTES = 64 * 1024 * 1024
+"""Bytes of input tokenised at a time."""
+
+NUMPY_MIN_BYTES = 1024 * 1024
+"""Smaller inputs are followed line by line, they are done before numpy is imported."""
+
+
+@dataclass(frozen=True)
+class Course:
+    forward: int = 0
+    aim: int = 0
+    """The change of aim, or the depth as part A understands it."""
+    depth: int = 0
+    """The depth as part B understands it, with an aim of 0 at the start."""
+
+    def __add__(self, other: "Course") -> "Course":
+        return Course(
+            forward=self.forward + other.forward,
+            aim=self.aim + other.aim,
+            depth=self.depth + other.depth + self.aim * other.forward,
+        )
+
+
+def course_of_lines(lines: Iterable[str]) -> Course:
+    """Return the course of the commands in lines, one at a time."""
+    forward = aim = depth = 0
+    for line in lines:
+        if not line.strip():
+            continue
+
+        direction, value_string = line.split()
+        value = int(value_string)
+
+        if direction == "down":
+            aim += value
+
+        elif direction == "up":
+            aim -= value
+
+        else:
+            forward += value
+            depth += aim * value
+
+    return Course(forward, aim, depth)
+
+
+def tokenise(buffer: loader.Buffer):
+    """Return an array with the opcode (first character) and one with the value of every line.
+
+    Empty lines have neither, they are skipped.
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+    line_starts = numpy.flatnonzero(data[:-1] == ord("\n")) + 1
+    opcodes = data[numpy.concatenate(([0], line_starts))] if len(data) else data
+    opcodes = opcodes[(opcodes != ord("\n")) & (opcodes != ord("\r"))]
+
+    return opcodes, loader.integers(buffer)
+
+
+def course_of_tokens(opcodes, values) -> Course:
+    """Return the course of tokenised commands."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    forward = numpy.where(opcodes == ord("f"), values, 0)
+    aim_change = numpy.where(opcodes == ord("d"), values, 0)
+    aim_change -= numpy.where(opcodes == ord("u"), values, 0)
+    aim = numpy.cumsum(aim_change)
+
+    return Course(
+        forward=int(forward.sum()),
+        aim=int(aim[-1]) if len(aim) else 0,
+        depth=int(numpy.dot(aim, forward)),
+    )
+
+
+def chunks(
+    buffer: loader.Buffer, start: int = 0, stop: Optional[int] = None
+) -> Iterable[memoryview]:
+    """Return the bytes start:stop of buffer in pieces of about CHUNK_BYTES whole lines."""
+    view = memoryview(buffer)
+    stop = len(buffer) if stop is None else stop
+    while start < stop:
+        end = stop
+        if start + CHUNK_BYTES < stop:
+            end = buffer.rfind(b"\n", start, start + CHUNK_BYTES) + 1 or stop
+
+        yield view[start:end]
+        start = end
+
+
+def course_of_buffer(
+    buffer: loader.Buffer, start: int = 0, stop: Optional[int] = None
+) -> Course:
+    """Return the course of the commands in bytes start:stop of buffer, a chunk at a time."""
+    return sum(
+        (course_of_tokens(*tokenise(chunk)) for chunk in chunks(buffer, start, stop)),
+        Course(),
+    )
+
+
+def course_of_range(path: str, start: int, stop: int) -> Course:
+    """Return the course of the commands in bytes start:stop of the file, in a worker."""
+    return course_of_buffer(loader.read_input(path), start, stop)
+
+
+def byte_ranges(buffer: loader.Buffer, parts: int) -> List[Tuple[int, int]]:
+    """Return (start, stop) of about equal parts of buffer, split after the end of a line."""
+    boundaries = [0]
+    for part in range(1, parts):
+        boundary = buffer.find(b"\n", len(buffer) * part // parts) + 1 or len(buffer)
+        boundaries.append(max(boundary, boundaries[-1]))
+
+    boundaries.append(len(buffer))
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def course_in_parallel(path: str, buffer: loader.Buffer, workers: int) -> Course:
+    """Return the course of the commands in the file, split over workers processes."""
+    starts, stops = zip(*byte_ranges(buffer, workers))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        courses = executor.map(course_of_range, [path] * workers, starts, stops)
+
+        return sum(courses, Course())
+
+
+def input_path() -> str:
+    """Return a path to the file on stdin, for the worker processes to open."""
+    if os.path.isfile(sys.stdin.name):
+        return sys.stdin.name
+
+    # Redirected by the shell, the forked workers inherit the file descriptor
+    return f"/dev/fd/{sys.stdin.fileno()}"
+
+
+def follow(workers: int = 1) -> Course:
+    """Return the course of the commands on stdin.
+
+    Big inputs in a file are split over workers processes if more than one.
+    """
+    try:
+        buffer = loader.map_file(sys.stdin.fileno())
+
+    except (AttributeError, OSError, ValueError):  # i.e. io.StringIO has no file number
+        buffer = None
+
+    if buffer is None or len(buffer) < NUMPY_MIN_BYTES:
+        return course_of_lines(sys.stdin)
+
+    try:
+        if workers > 1:
+            return course_in_parallel(input_path(), buffer, workers)
+
+        return course_of_buffer(buffer)
+
+    except ImportError:
+        return course_of_lines(sys.stdin)
+
+
+class TestCourse(unittest.TestCase):
+    EXAMPLE = b"forward 5\ndown 5\nforward 8\nup 3\ndown 8\nforward 2\n"
+
+    def test_example_should_end_at_example_position(self):
+        # Given
+        lines = self.EXAMPLE.decode().splitlines()
+
+        # When
+        result = course_of_lines(lines)
+
+        # Then
+        self.assertEqual(Course(forward=15, aim=10, depth=60), result)
+
+    def test_added_courses_should_equal_course_of_all_commands(self):
+        # Given
+        lines = self.EXAMPLE.decode().splitlines()
+
+        # When
+        result = course_of_lines(lines[:3]) + course_of_lines(lines[3:])
+
+        # Then
+        self.assertEqual(course_of_lines(lines), result)
+
+    def test_byte_ranges_should_split_after_whole_lines(self):
+        # Given
+        buffer = self.EXAMPLE
+
+        # When
+        result = byte_ranges(buffer, 3)
+
+        # Then
+        self.assertEqual([(0, 17), (17, 39), (39, 49)], result)
+        self.assertEqual(
+            course_of_lines(buffer.decode().splitlines()),
+            sum((course_of_buffer(buffer, *byte_range) for byte_range in result), Course()),
+        )
+
+    def test_tokens_should_give_same_course_as_lines(self):
+        # Given
+        buffer = self.EXAMPLE
+
+        # When
+        result = course_of_tokens(*tokenise(buffer))
+
+        # Then
+        self.assertEqual(course_of_lines(buffer.decode().splitlines()), result)
+
+    def test_empty_lines_should_be_skipped(self):
+        # Given
+        buffer = b"\n" + self.EXAMPLE.replace(b"up 3\n", b"up 3\n\r\n\n")
+
+        # When
+        result = course_of_tokens(*tokenise(buffer)), course_of_lines(buffer.decode().splitlines())
+
+        # Then
+        expected = course_of_lines(self.EXAMPLE.decode().splitlines())
+        self.assertEqual((expected, expected), result)
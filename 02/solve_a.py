@@ -1,20 +1,17 @@
 #!/usr/bin/env python
 
-import sys
-from pprint import pprint
+from aoc import verbosity
 
-position = {
-    "forward": 0,
-    "down": 0,
-    "up": 0,
-}
+from navigation import follow
 
-for line in sys.stdin:
-    direction, value = line.split()
 
-    position[direction] += int(value)
+def main() -> None:
+    course = follow()
 
-pprint(position)
+    verbosity.info(course.forward, course.aim)
+    print(course.forward * course.aim)
 
-print(position["forward"], position["down"] - position["up"])
-print(position["forward"] * (position["down"] - position["up"]))
+
+if __name__ == "__main__":
+    verbosity.parse_arguments()
+    main()
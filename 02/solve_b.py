@@ -1,32 +1,24 @@
 #!/usr/bin/env python
+"""Usage: solve_b.py [WORKERS] < input.txt
 
-import sys
-
-
-def main() -> None:
-    horizontal = 0
-    depth = 0
-    aim = 0
+Big inputs are split over WORKERS processes, by default 1.
+"""
 
-    for line in sys.stdin:
-        direction, value_string = line.split()
-        value = int(value_string)
-
-        if direction == "down":
-            aim += value
+import sys
 
-        elif direction == "up":
-            aim -= value
+from aoc import verbosity
 
-        elif direction == "forward":
-            horizontal += value
+from navigation import follow
 
-            depth += aim * value
 
-    print(horizontal, depth, aim)
+def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    course = follow(workers)
 
-    print(horizontal * depth)
+    verbosity.info(course.forward, course.depth, course.aim)
+    print(course.forward * course.depth)
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -0,0 +1,201 @@
+"""The diagnostic report packed into an array with one integer per row.
+
+A row of up to 64 bits takes 8 bytes, and every question about a bit
+position is answered for all rows at once with shifts and masks. Small
+reports are a list of ints instead, they are done before numpy is imported,
+and so are wider rows, which don't fit.
+
+The ratings are found in the sorted rows. The rows sharing the bits to the
+left of a column are a contiguous range, the ones with a 0 in the column
+first, so every column is a single binary search.
+"""
+
+import unittest
+from bisect import bisect_left
+from functools import cached_property
+from typing import List
+from typing import Sequence
+
+from aoc import loader
+
+NUMPY_MIN_BYTES = 1024 * 1024
+"""Smaller reports are parsed line by line into a list of ints."""
+
+ARRAY_MAX_WIDTH = 64
+"""Bits in a uint64, wider rows are parsed into a list of ints."""
+
+
+class Report:
+    def __init__(self, rows: Sequence[int], width: int) -> None:
+        self.rows = rows
+        """A list of ints or a numpy array of uint64."""
+        self.width = width
+
+    @classmethod
+    def from_buffer(cls, buffer: loader.Buffer) -> "Report":
+        """Return the report in buffer, rows of "0" and "1" all of the same width."""
+        width = buffer.find(b"\n")
+        if width == -1:
+            width = len(buffer)
+
+        if len(buffer) >= NUMPY_MIN_BYTES and width <= ARRAY_MAX_WIDTH:
+            try:
+                return cls(cls.array_from_buffer(buffer, width), width)
+
+            except ImportError:
+                pass
+
+        return cls([int(line, 2) for line in loader.lines(buffer) if line], width)
+
+    @staticmethod
+    def array_from_buffer(buffer: loader.Buffer, width: int):
+        """Return the rows in buffer as a numpy array of uint64, at most ARRAY_MAX_WIDTH wide."""
+        if width > ARRAY_MAX_WIDTH:
+            raise ValueError(f"rows of {width} bits don't fit in uint64")
+
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+
+        # Every row with its newline, except maybe the last one
+        row_count = (len(data) + 1) // (width + 1)
+        rows_data = data[: row_count * (width + 1)]
+        characters = numpy.zeros((row_count, width + 1), dtype=numpy.uint8)
+        characters.flat[: len(rows_data)] = rows_data
+
+        rows = numpy.zeros(row_count, dtype=numpy.uint64)
+        for column in range(width):
+            rows <<= numpy.uint64(1)
+            rows |= characters[:, column] == ord("1")
+
+        return rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def mask(self) -> int:
+        return (1 << self.width) - 1
+
+    def count_ones(self, position: int) -> int:
+        """Return the number of rows with a 1 at position, counted from the right."""
+        if isinstance(self.rows, list):
+            return sum(row >> position & 1 for row in self.rows)
+
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        return int(((self.rows >> numpy.uint64(position)) & numpy.uint64(1)).sum())
+
+    def column_counts(self) -> List[int]:
+        """Return the number of ones in every column, the leftmost column first."""
+        return [self.count_ones(position) for position in range(self.width - 1, -1, -1)]
+
+    def gamma_rate(self) -> int:
+        """Return the number made of the most common bit of every column."""
+        gamma_rate = 0
+        for count in self.column_counts():
+            gamma_rate = (gamma_rate << 1) | int(2 * count > len(self))
+
+        return gamma_rate
+
+    def epsilon_rate(self) -> int:
+        """Return the number made of the least common bit of every column."""
+        return self.mask & ~self.gamma_rate()
+
+    @cached_property
+    def sorted_rows(self) -> Sequence[int]:
+        rows = self.rows.copy()
+        rows.sort()
+
+        return rows
+
+    def rating(self, keep_common: bool) -> int:
+        """Return the row left after keeping the rows with the most (or least) common bits.
+
+        Column by column from the left, rows with the most common bit are kept,
+        or the least common if not keep_common. Ties count as 1 being the most
+        common. A column where all rows agree keeps them all.
+
+        Takes O(width * log rows) after sorting the rows once.
+        """
+        rows = self.sorted_rows
+        low, high = 0, len(rows)
+        prefix = 0
+        for position in range(self.width - 1, -1, -1):
+            if high - low == 1:
+                break
+
+            # The rows in low:high all start with prefix, the ones with a 1 at
+            # position start at split
+            bit = 1 << position
+            split = bisect_left(rows, prefix | bit, low, high)
+            ones = high - split
+            if ones == 0:
+                continue
+
+            one_is_common = 2 * ones >= high - low
+            if split == low or one_is_common == keep_common:
+                low = split
+                prefix |= bit
+
+            else:
+                high = split
+
+        return int(rows[low])
+
+    def format(self, value: int) -> str:
+        return format(value, f"0{self.width}b")
+
+
+class TestReport(unittest.TestCase):
+    EXAMPLE = (
+        b"00100\n11110\n10110\n10111\n10101\n01111\n"
+        b"00111\n11100\n10000\n11001\n00010\n01010\n"
+    )
+
+    def test_example_should_have_example_rates(self):
+        # Given
+        report = Report.from_buffer(self.EXAMPLE)
+
+        # When
+        result = report.gamma_rate(), report.epsilon_rate()
+
+        # Then
+        self.assertEqual((22, 9), result)
+
+    def test_example_should_have_example_ratings(self):
+        # Given
+        report = Report.from_buffer(self.EXAMPLE.strip())
+
+        # When
+        result = report.rating(keep_common=True), report.rating(keep_common=False)
+
+        # Then
+        self.assertEqual((23, 10), result)
+
+    def test_array_should_have_same_answers_as_list(self):
+        # Given
+        report = Report.from_buffer(self.EXAMPLE)
+        array_report = Report(Report.array_from_buffer(self.EXAMPLE, report.width), report.width)
+
+        # When
+        result = [
+            (r.gamma_rate(), r.rating(keep_common=True), r.rating(keep_common=False))
+            for r in (report, array_report)
+        ]
+
+        # Then
+        self.assertEqual([(22, 23, 10)] * 2, result)
+
+    def test_rows_wider_than_uint64_should_be_a_list(self):
+        # Given
+        rows = [(1 << 69) | row for row in range(NUMPY_MIN_BYTES // 71 + 1)]
+        buffer = b"".join(b"%s\n" % format(row, "070b").encode() for row in rows)
+
+        # When
+        result = Report.from_buffer(buffer)
+
+        # Then
+        self.assertEqual(rows, result.rows)
+        with self.assertRaises(ValueError):
+            Report.array_from_buffer(buffer, 70)
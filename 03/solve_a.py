@@ -1,31 +1,24 @@
 #!/usr/bin/env python
 
-import sys
-from pprint import pprint
-from typing import List
+from aoc import loader
+from aoc import verbosity
 
-def list_as_dec(binary_list: List[int]) -> int:
-    return int("0b" + "".join(map(str, binary_list)), base=2)
+from diagnostics import Report
 
 
 def main() -> None:
-    lines = sys.stdin.readlines()
-    line_count = len(lines)
-    matrix = [list(map(int, line.strip())) for line in lines]
-    # pprint(matrix)
+    report = Report.from_buffer(loader.read_input())
 
-    sums = [sum(column) for column in zip(*matrix)]
-    pprint(sums)
-    averages = [int(n > (line_count / 2)) for n in sums]
-    pprint(averages)
+    verbosity.info(report.column_counts())
 
-    gamma_rate = list_as_dec(averages)
-    pprint(gamma_rate)
-    sigma_rate = list_as_dec(int(not n) for n in averages)
-    pprint(sigma_rate)
+    gamma_rate = report.gamma_rate()
+    verbosity.info(report.format(gamma_rate), gamma_rate)
+    epsilon_rate = report.epsilon_rate()
+    verbosity.info(report.format(epsilon_rate), epsilon_rate)
 
-    print(gamma_rate * sigma_rate)
+    print(gamma_rate * epsilon_rate)
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
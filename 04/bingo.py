@@ -0,0 +1,246 @@
+"""Play bingo on any number of boards at once.
+
+Every number is looked up once in an index of where it is on all boards, so
+a draw only touches the cells with that number. Every board keeps how many
+cells are marked in each row and column and the sum of its unmarked cells,
+a board has won as soon as a row or column count reaches the size.
+
+Big games aren't played at all. A line is complete on the turn its last
+number is drawn, the latest draw rank of its numbers, and a board wins on the
+turn its first line is complete. With the draw ranks of all boards in one
+numpy array, the turns of all boards are a max and a min away, and both the
+first and the last winner come out of the same pass.
+"""
+
+import unittest
+from collections import defaultdict
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from aoc import loader
+
+SIZE = 5
+
+MARKED = "\033[7m"
+RESET = "\033[0m"
+
+NUMPY_MIN_BYTES = 1024 * 1024
+"""Smaller games are played out, they are done before numpy is imported."""
+
+
+class Win(NamedTuple):
+    board: int
+    number: int
+    score: int
+
+
+class Bingo:
+    def __init__(self, boards: List[List[int]], size: int = SIZE) -> None:
+        self.boards = boards
+        self.size = size
+
+        self.index: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+        for board, numbers in enumerate(boards):
+            for cell, number in enumerate(numbers):
+                self.index[number].append((board, *divmod(cell, size)))
+
+        self.row_marks = [0] * (len(boards) * size)
+        self.column_marks = [0] * (len(boards) * size)
+        self.unmarked_sums = [sum(numbers) for numbers in boards]
+        self.marked = bytearray(len(boards) * size * size)
+        self.won = [False] * len(boards)
+        self.winners = 0
+
+    def draw(self, number: int) -> List[Win]:
+        """Mark number on all boards and return the boards winning now, in board order."""
+        size = self.size
+        wins = []
+        for board, row, column in self.index.get(number, ()):
+            if self.won[board]:
+                continue
+
+            self.marked[(board * size + row) * size + column] = 1
+            self.unmarked_sums[board] -= number
+
+            row_index = board * size + row
+            column_index = board * size + column
+            self.row_marks[row_index] += 1
+            self.column_marks[column_index] += 1
+            if self.row_marks[row_index] == size or self.column_marks[column_index] == size:
+                self.won[board] = True
+                self.winners += 1
+                wins.append(Win(board, number, self.unmarked_sums[board] * number))
+
+        return wins
+
+    def rounds(self, numbers: Iterable[int]) -> Iterator[Tuple[int, List[Win]]]:
+        """Return iterator over (number, wins) for every draw, until all boards have won."""
+        for number in numbers:
+            yield number, self.draw(number)
+
+            if self.winners == len(self.boards):
+                return
+
+    def play(self, numbers: Iterable[int]) -> Iterator[Win]:
+        """Return iterator over the wins, in the order the boards win."""
+        for _number, wins in self.rounds(numbers):
+            yield from wins
+
+    def render(self, board: int) -> str:
+        """Return the board with the marked numbers highlighted, beware of ansi escapes."""
+        start = board * self.size * self.size
+        cells = [
+            f"{MARKED if self.marked[start + cell] else ''}{number : >2}{RESET}"
+            for cell, number in enumerate(self.boards[board])
+        ]
+
+        return "\n".join(
+            " ".join(cells[row : row + self.size])
+            for row in range(0, len(cells), self.size)
+        )
+
+
+def read_game(buffer: loader.Buffer) -> Tuple[List[int], List[List[int]]]:
+    """Return the numbers to draw and the boards, each a flat list of numbers."""
+    blocks = loader.blocks(buffer)
+    numbers = [int(number) for number in next(blocks).split(",")]
+    boards = [[int(number) for number in block.split()] for block in blocks]
+
+    return numbers, boards
+
+
+def read_arrays(buffer: loader.Buffer, size: int = SIZE):
+    """Return the numbers to draw and the boards, an array of shape (n, size, size)."""
+    values = loader.integers(buffer)
+    end = buffer.find(b"\n")
+    draw_count = buffer[: len(buffer) if end == -1 else end].count(b",") + 1
+
+    return values[:draw_count], values[draw_count:].reshape(-1, size, size)
+
+
+def win_turns(numbers, boards):
+    """Return the turn every board wins on, len(numbers) for boards that never win."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    # Numbers never drawn are drawn after the last turn. Assigned in reverse,
+    # so a number drawn twice keeps its first turn.
+    ranks = numpy.full(
+        max(int(numbers.max(initial=0)), int(boards.max(initial=0))) + 1,
+        len(numbers),
+        dtype=numpy.int64,
+    )
+    ranks[numbers[::-1]] = numpy.arange(len(numbers) - 1, -1, -1)
+    board_ranks = ranks[boards]
+
+    rows = board_ranks.max(axis=2).min(axis=1)
+    columns = board_ranks.max(axis=1).min(axis=1)
+
+    return numpy.minimum(rows, columns), board_ranks
+
+
+def closed_form_wins(numbers, boards) -> Tuple[Win, ...]:
+    """Return the first and the last win without playing the game, () if no board wins.
+
+    Boards winning on the same turn win in board order, like in Bingo.play.
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    turns, board_ranks = win_turns(numbers, boards)
+    winners = numpy.flatnonzero(turns < len(numbers))
+    if winners.size == 0:
+        return ()
+
+    first = int(winners[numpy.argmin(turns[winners])])
+    last = int(winners[::-1][numpy.argmax(turns[winners][::-1])])
+
+    def win(board: int) -> Win:
+        turn = int(turns[board])
+        unmarked_sum = int(boards[board][board_ranks[board] > turn].sum())
+
+        return Win(board, int(numbers[turn]), unmarked_sum * int(numbers[turn]))
+
+    return win(first), win(last)
+
+
+def big_game_wins(buffer: loader.Buffer) -> Optional[Tuple[Win, ...]]:
+    """Return closed_form_wins() of a big game, None if it should be played out."""
+    if len(buffer) < NUMPY_MIN_BYTES:
+        return None
+
+    try:
+        return closed_form_wins(*read_arrays(buffer))
+
+    except ImportError:
+        return None
+
+
+class TestBingo(unittest.TestCase):
+    EXAMPLE = b"""7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
+
+22 13 17 11  0
+ 8  2 23  4 24
+21  9 14 16  7
+ 6 10  3 18  5
+ 1 12 20 15 19
+
+ 3 15  0  2 22
+ 9 18 13 17  5
+19  8  7 25 23
+20 11 10 24  4
+14 21 16 12  6
+
+14 21 17 24  4
+10 16 15  9 19
+18  8 23 26 20
+22 11 13  6  5
+ 2  0 12  3  7
+"""
+
+    def test_example_should_have_first_and_last_winner(self):
+        # Given
+        numbers, boards = read_game(self.EXAMPLE)
+
+        # When
+        result = list(Bingo(boards).play(numbers))
+
+        # Then
+        self.assertEqual(Win(board=2, number=24, score=4512), result[0])
+        self.assertEqual(Win(board=1, number=13, score=1924), result[-1])
+
+    def test_closed_form_should_have_same_wins_as_playing(self):
+        # Given
+        numbers, boards = read_arrays(self.EXAMPLE)
+
+        # When
+        result = closed_form_wins(numbers, boards)
+
+        # Then
+        self.assertEqual((Win(2, 24, 4512), Win(1, 13, 1924)), result)
+
+    def test_board_never_winning_should_not_be_last_winner(self):
+        # Given
+        buffer = self.EXAMPLE + b"\n" + b" ".join(b"%d" % number for number in range(100, 125))
+        numbers, boards = read_game(buffer)
+
+        # When
+        played = list(Bingo(boards).play(numbers))
+        _first, closed_form_last = closed_form_wins(*read_arrays(buffer))
+
+        # Then
+        self.assertEqual([Win(1, 13, 1924)] * 2, [played[-1], closed_form_last])
+
+    def test_no_board_winning_should_have_no_wins(self):
+        # Given
+        buffer = b"7,4,9" + self.EXAMPLE[self.EXAMPLE.index(b"\n") :]
+        numbers, boards = read_game(buffer)
+
+        # When
+        result = list(Bingo(boards).play(numbers)), closed_form_wins(*read_arrays(buffer))
+
+        # Then
+        self.assertEqual(([], ()), result)
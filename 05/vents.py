@@ -0,0 +1,366 @@
+"""Count the points where hydrothermal vent lines overlap.
+
+The lines are read into an array with one row (x1, y1, x2, y2) per line and
+drawn onto a canvas covering their bounding box, one uint16 count per point.
+Horizontal and vertical lines are a slice of a row or a column each, the
+points of all diagonal lines are added at once with numpy.add.at. The
+overlaps are then a single count over the whole canvas. Small inputs are
+never drawn, they are swept (see below) before numpy would be imported.
+
+When the bounding box is too big for a canvas the lines are swept instead,
+without a single point being drawn. Every line lies on a line a * x + b * y =
+key of one of four orientations. The segments on the same line are merged
+into what they cover and what they cover at least twice, in sorted order.
+Segments of different orientations meet in at most one point, for every pair
+of orientations the crossings are found by sweeping over the key of one with
+the keys of the active segments of the other in a sorted list.
+"""
+
+import itertools
+import math
+import re
+import unittest
+from bisect import bisect_left
+from bisect import bisect_right
+from bisect import insort
+from operator import itemgetter
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from aoc import loader
+
+NUMPY_MIN_BYTES = 32 * 1024
+"""Smaller inputs are read into a list and swept, they are done before numpy is imported.
+
+The crossings of dense inputs slow the sweep down, at about 32 KiB it takes
+as long as importing numpy.
+"""
+
+CANVAS_MAX_POINTS = 64 * 1024 * 1024
+"""Bigger bounding boxes are swept, the canvas would take more than 128 MiB."""
+
+HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL = range(4)
+LINES = ((0, 1), (1, 0), (-1, 1), (1, 1))
+"""(a, b) of the lines a * x + b * y = key of every orientation."""
+
+Interval = Tuple[int, int]
+Point = Tuple[int, int]
+Segment = Tuple[int, int, int, int]
+
+
+def read_segments(buffer: loader.Buffer):
+    """Return the lines in buffer as (x1, y1, x2, y2) rows.
+
+    Big inputs are a numpy array, small ones a list of tuples.
+    """
+    if len(buffer) >= NUMPY_MIN_BYTES:
+        try:
+            return loader.integers(buffer).reshape(-1, 4)
+
+        except (ImportError, AttributeError):  # i.e. an array.array without numpy
+            pass
+
+    values = [int(value) for value in re.findall(rb"-?\d+", buffer)]
+
+    return list(zip(*[iter(values)] * 4))
+
+
+def orientations(segments):
+    """Return masks of the horizontal, vertical and diagonal segments."""
+    horizontal = segments[:, 1] == segments[:, 3]
+    vertical = (segments[:, 0] == segments[:, 2]) & ~horizontal
+
+    return horizontal, vertical, ~(horizontal | vertical)
+
+
+def diagonal_points(segments):
+    """Return arrays with the x and the y of every point on the diagonal segments."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    x1, y1, x2, y2 = segments.T
+    lengths = numpy.abs(x2 - x1) + 1
+
+    # The segment of every point, and how far along the segment it is
+    segment = numpy.repeat(numpy.arange(len(segments)), lengths)
+    steps = numpy.arange(lengths.sum()) - numpy.repeat(numpy.cumsum(lengths) - lengths, lengths)
+
+    xs = x1[segment] + numpy.sign(x2 - x1)[segment] * steps
+    ys = y1[segment] + numpy.sign(y2 - y1)[segment] * steps
+
+    return xs, ys
+
+
+def canvas_overlaps(segments, diagonals: bool = True) -> int:
+    """Return the number of points covered by at least two segments, drawn on a canvas."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    segments = numpy.asarray(segments, dtype=numpy.int64).reshape(-1, 4)
+    horizontal, vertical, diagonal = orientations(segments)
+    if not diagonals:
+        segments = segments[~diagonal]
+        horizontal, vertical, diagonal = orientations(segments)
+
+    if not len(segments):
+        return 0
+
+    # Move the bounding box to the origin
+    low_x = min(segments[:, 0].min(), segments[:, 2].min())
+    low_y = min(segments[:, 1].min(), segments[:, 3].min())
+    segments = segments - (low_x, low_y, low_x, low_y)
+    width = max(segments[:, 0].max(), segments[:, 2].max()) + 1
+    height = max(segments[:, 1].max(), segments[:, 3].max()) + 1
+
+    canvas = numpy.zeros((height, width), dtype=numpy.uint16)
+    for x1, y, x2, _y in segments[horizontal].tolist():
+        canvas[y, min(x1, x2) : max(x1, x2) + 1] += 1
+
+    for x, y1, _x, y2 in segments[vertical].tolist():
+        canvas[min(y1, y2) : max(y1, y2) + 1, x] += 1
+
+    xs, ys = diagonal_points(segments[diagonal])
+    numpy.add.at(canvas, (ys, xs), 1)
+
+    return int(numpy.count_nonzero(canvas >= 2))
+
+
+def orientation(x1: int, y1: int, x2: int, y2: int) -> int:
+    if y1 == y2:
+        return HORIZONTAL
+
+    if x1 == x2:
+        return VERTICAL
+
+    return DIAGONAL if (x2 - x1) * (y2 - y1) > 0 else ANTIDIAGONAL
+
+
+def add_interval(intervals: List[Interval], low: int, high: int) -> None:
+    """Add low..high to sorted, disjoint intervals, low not below the last low."""
+    if intervals and low <= intervals[-1][1] + 1:
+        intervals[-1] = (intervals[-1][0], max(intervals[-1][1], high))
+
+    else:
+        intervals.append((low, high))
+
+
+class Lines:
+    """The segments of one orientation, merged line by line.
+
+    A point on a line is its key and its position along the line, the y of
+    vertical lines and the x of all others.
+    """
+
+    def __init__(self, orientation: int) -> None:
+        self.orientation = orientation
+        self.a, self.b = LINES[orientation]  # pylint: disable=invalid-name
+
+        self.covered: Dict[int, List[Interval]] = {}
+        """Sorted intervals covered on every line, touching ones merged."""
+        self.twice: Dict[int, List[Interval]] = {}
+        """Sorted intervals covered at least twice on every line."""
+
+    def key(self, x: int, y: int) -> int:  # pylint: disable=invalid-name
+        return self.a * x + self.b * y
+
+    def position(self, x: int, y: int) -> int:  # pylint: disable=invalid-name
+        return y if self.orientation == VERTICAL else x
+
+    def point(self, key: int, position: int) -> Point:
+        if self.orientation == VERTICAL:
+            return key, position
+
+        return position, (key - self.a * position) // self.b
+
+    @classmethod
+    def from_segments(cls, orientation: int, segments: List[Segment]) -> "Lines":
+        lines = cls(orientation)
+        intervals = sorted(
+            (
+                lines.key(x1, y1),
+                min(lines.position(x1, y1), lines.position(x2, y2)),
+                max(lines.position(x1, y1), lines.position(x2, y2)),
+            )
+            for x1, y1, x2, y2 in segments
+        )
+
+        for key, group in itertools.groupby(intervals, key=itemgetter(0)):
+            covered: List[Interval] = []
+            twice: List[Interval] = []
+            for _key, low, high in group:
+                # Whatever the previous segments cover is covered twice now
+                if covered and low <= covered[-1][1]:
+                    add_interval(twice, low, min(high, covered[-1][1]))
+
+                add_interval(covered, low, high)
+
+            lines.covered[key] = covered
+            if twice:
+                lines.twice[key] = twice
+
+        return lines
+
+    def count_twice(self) -> int:
+        return sum(high - low + 1 for intervals in self.twice.values() for low, high in intervals)
+
+    def is_twice(self, point: Point) -> bool:
+        intervals = self.twice.get(self.key(*point), [])
+        position = self.position(*point)
+        index = bisect_right(intervals, (position, math.inf)) - 1
+
+        return index >= 0 and intervals[index][1] >= position
+
+    def ends(self, other: "Lines") -> Iterator[Tuple[int, int, int]]:
+        """Return iterator over (key, low, high) of the covered intervals, in keys of other."""
+        for key, intervals in self.covered.items():
+            for low, high in intervals:
+                first, last = (other.key(*self.point(key, end)) for end in (low, high))
+                yield key, min(first, last), max(first, last)
+
+
+def crossing(lines: Lines, key: int, other: Lines, other_key: int) -> Optional[Point]:
+    """Return the point where two lines of different orientation cross, None if not a point."""
+    determinant = lines.a * other.b - other.a * lines.b
+    x, remainder_x = divmod(key * other.b - other_key * lines.b, determinant)
+    y, remainder_y = divmod(lines.a * other_key - other.a * key, determinant)
+    if remainder_x or remainder_y:
+        return None
+
+    return x, y
+
+
+def crossings(lines: Lines, other: Lines) -> Iterator[Point]:
+    """Return iterator over the points where covered intervals of lines and other cross.
+
+    The sweep goes over the keys of other. The lines with a covered interval
+    at the sweep are active, sorted by key, and every interval of other
+    crosses the active lines with keys in its range.
+    """
+    insert, query, remove = range(3)
+    events = []
+    for key, low, high in lines.ends(other):
+        events.append((low, insert, key, key))
+        events.append((high, remove, key, key))
+
+    for other_key, low, high in other.ends(lines):
+        events.append((other_key, query, low, high))
+
+    active: List[int] = []
+    for at, event, low, high in sorted(events):
+        if event == insert:
+            insort(active, low)
+
+        elif event == remove:
+            active.pop(bisect_left(active, low))
+
+        else:
+            for key in active[bisect_left(active, low) : bisect_right(active, high)]:
+                point = crossing(lines, key, other, at)
+                if point is not None:
+                    yield point
+
+
+def sweep_overlaps(segments, diagonals: bool = True) -> int:
+    """Return the number of points covered by at least two segments, without drawing them.
+
+    Takes O(n log n + k) for the n segments and the k crossings between
+    orientations, more if many lines are active at once.
+    """
+    if not isinstance(segments, list):
+        segments = segments.tolist()
+
+    by_orientation: Dict[int, List[Segment]] = {}
+    for segment in segments:
+        by_orientation.setdefault(orientation(*segment), []).append(segment)
+
+    if not diagonals:
+        by_orientation.pop(DIAGONAL, None)
+        by_orientation.pop(ANTIDIAGONAL, None)
+
+    all_lines = [
+        Lines.from_segments(line_orientation, line_segments)
+        for line_orientation, line_segments in sorted(by_orientation.items())
+    ]
+
+    count = sum(lines.count_twice() for lines in all_lines)
+
+    points: Set[Point] = set()
+    for lines, other in itertools.combinations(all_lines, 2):
+        points.update(crossings(lines, other))
+
+    # A crossing is covered twice. It is counted already if covered twice by
+    # one orientation, and once too many for every further orientation.
+    for point in points:
+        count += 1 - sum(lines.is_twice(point) for lines in all_lines)
+
+    return count
+
+
+def overlaps(segments, diagonals: bool = True) -> int:
+    """Return the number of points covered by at least two segments.
+
+    The segments of a small input (a list) are swept. An array of segments is
+    drawn on a canvas if their bounding box fits, otherwise swept.
+    """
+    if isinstance(segments, list) or not len(segments):
+        return sweep_overlaps(segments, diagonals)
+
+    width = int(segments[:, 0::2].max() - segments[:, 0::2].min()) + 1
+    height = int(segments[:, 1::2].max() - segments[:, 1::2].min()) + 1
+    if width * height <= CANVAS_MAX_POINTS:
+        return canvas_overlaps(segments, diagonals)
+
+    return sweep_overlaps(segments, diagonals)
+
+
+class TestCanvas(unittest.TestCase):
+    EXAMPLE = b"""0,9 -> 5,9
+8,0 -> 0,8
+9,4 -> 3,4
+2,2 -> 2,1
+7,0 -> 7,4
+6,4 -> 2,0
+0,9 -> 2,9
+3,4 -> 1,4
+0,0 -> 8,8
+5,5 -> 8,2
+"""
+
+    def test_example_should_have_example_overlaps(self):
+        # Given
+        segments = read_segments(self.EXAMPLE)
+
+        # When
+        result = canvas_overlaps(segments, diagonals=False), canvas_overlaps(segments)
+
+        # Then
+        self.assertEqual((5, 12), result)
+
+
+class TestSweep(unittest.TestCase):
+    def test_example_should_have_example_overlaps(self):
+        # Given
+        segments = read_segments(TestCanvas.EXAMPLE)
+
+        # When
+        result = sweep_overlaps(segments, diagonals=False), sweep_overlaps(segments)
+
+        # Then
+        self.assertEqual((5, 12), result)
+
+    def test_random_lines_should_have_same_overlaps_as_canvas(self):
+        # Given
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        rng = numpy.random.default_rng(5)
+        starts = rng.integers(10, 30, size=(200, 2))
+        directions = rng.integers(-1, 2, size=(200, 2))
+        segments = numpy.hstack((starts, starts + directions * rng.integers(0, 10, size=(200, 1))))
+
+        # When
+        result = sweep_overlaps(segments)
+
+        # Then
+        self.assertEqual(canvas_overlaps(segments), result)
@@ -0,0 +1,249 @@
+"""Grow a school of lanternfish any number of days at once.
+
+A day is linear in the nine counts of a Generation, so it is a 9x9 matrix
+and N days are its N:th power. The power is found by repeated squaring in
+O(log N) matrix products, with exact integers or modulo a number for days
+where the population has more digits than fit in memory.
+
+The size of a school is linear in its generation too: the sizes after N days
+of single fish with every timer, dotted with the generation. Those sizes for
+many checkpoints come from one set of squares, each checkpoint continuing
+from the previous one, and then serve any number of schools.
+"""
+
+import contextlib
+import sys
+import unittest
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+Generation = List[int]
+"""One position for each timer value, counter for number of fish with that timer value.
+"""
+
+Matrix = List[List[int]]
+
+TIMERS = 9
+
+
+@contextlib.contextmanager
+def unlimited_digits():
+    """Lift the limit on the digits of int to str conversions, and restore it afterwards.
+
+    Exact populations of long stretches have more digits than Python prints by
+    default, but the limit is for the whole process, i.e. the in-process runner.
+    """
+    previous = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+
+    finally:
+        sys.set_int_max_str_digits(previous)
+
+
+def generation_from_string(string: str) -> Generation:
+    """Return a Generation parsed from string."""
+    generation = [0] * TIMERS
+
+    timers = [int(s) for s in string.strip().split(",") if s]
+    # print(timers)
+    for timer in timers:
+        generation[timer] += 1
+
+    return generation
+
+
+def next_generation(generation: Generation) -> Generation:
+    """Return the next generation given the parent generation."""
+    # Shift timers and make sure theres always 9 elements
+    birther_count, *new_generation = generation + [0]
+
+    new_generation[6] += birther_count  # Reset timers of birthers
+    new_generation[8] += birther_count  # Birth new fish
+
+    return new_generation
+
+
+def day_matrix() -> Matrix:
+    """Return the matrix taking a generation to the next one, column timer is the parent."""
+    columns = [
+        next_generation([int(timer == parent) for timer in range(TIMERS)])
+        for parent in range(TIMERS)
+    ]
+
+    return [list(row) for row in zip(*columns)]
+
+
+def transpose(matrix: Matrix) -> Matrix:
+    return [list(row) for row in zip(*matrix)]
+
+
+def multiply(left: Matrix, right: Matrix, modulus: Optional[int] = None) -> Matrix:
+    columns = list(zip(*right))
+    product = [[sum(map(int.__mul__, row, column)) for column in columns] for row in left]
+    if modulus is not None:
+        product = [[value % modulus for value in row] for row in product]
+
+    return product
+
+
+def apply(matrix: Matrix, generation: Generation, modulus: Optional[int] = None) -> Generation:
+    """Return the matrix times the generation, as a column."""
+    result = [sum(map(int.__mul__, row, generation)) for row in matrix]
+    if modulus is not None:
+        result = [value % modulus for value in result]
+
+    return result
+
+
+def squares(matrix: Matrix, count: int, modulus: Optional[int] = None) -> List[Matrix]:
+    """Return the matrix to the powers 1, 2, 4, ... 2 ** (count - 1)."""
+    powers = [matrix][:count]
+    while len(powers) < count:
+        powers.append(multiply(powers[-1], powers[-1], modulus))
+
+    return powers
+
+
+def advance(
+    generation: Generation,
+    days: int,
+    modulus: Optional[int] = None,
+    powers: Optional[List[Matrix]] = None,
+) -> Generation:
+    """Return the generation days later, the counts modulo modulus if given.
+
+    Applies the squares of the day matrix for the bits set in days, O(log
+    days) 9x9 products. The squares are computed unless given as powers, at
+    least days.bit_length() of them.
+    """
+    if powers is None:
+        powers = squares(day_matrix(), days.bit_length(), modulus)
+
+    for bit, power in enumerate(powers[: days.bit_length()]):
+        if days >> bit & 1:
+            generation = apply(power, generation, modulus)
+
+    return generation
+
+
+def fish_sizes(
+    checkpoints: Iterable[int], modulus: Optional[int] = None
+) -> Iterator[Tuple[int, List[int]]]:
+    """Return iterator over (days, sizes) for the checkpoints in increasing order.
+
+    sizes[timer] is the size of a school of a single fish with timer after
+    days. The transposed day matrix takes these sizes one day further, and
+    its squares are shared by all checkpoints.
+    """
+    checkpoints = sorted(set(checkpoints))
+    if not checkpoints:
+        return
+
+    powers = squares(transpose(day_matrix()), checkpoints[-1].bit_length(), modulus)
+    sizes, days = [1] * TIMERS, 0
+    for checkpoint in checkpoints:
+        sizes = advance(sizes, checkpoint - days, modulus, powers)
+        days = checkpoint
+
+        yield days, sizes
+
+
+def school_sizes(
+    checkpoints: Iterable[int], schools: List[Generation], modulus: Optional[int] = None
+) -> Iterator[Tuple[int, List[int]]]:
+    """Return iterator over (days, size of every school) for the checkpoints in increasing order."""
+    for days, sizes in fish_sizes(checkpoints, modulus):
+        school_sizes_now = [sum(map(int.__mul__, sizes, school)) for school in schools]
+        if modulus is not None:
+            school_sizes_now = [size % modulus for size in school_sizes_now]
+
+        yield days, school_sizes_now
+
+
+class TestGenerationFromString(unittest.TestCase):
+    def test_empty_string_should_result_in_empty_generation(self):
+        # Given
+        string = ""
+
+        # When
+        result = generation_from_string(string)
+
+        # Then
+        expected = [0, 0, 0, 0, 0, 0, 0, 0, 0]
+        self.assertEqual(expected, result)
+
+    def test_single_number_should_be_reflected_in_generation(self):
+        # Given
+        string = "8"
+
+        # When
+        result = generation_from_string(string)
+
+        # Then
+        expected = [0, 0, 0, 0, 0, 0, 0, 0, 1]
+        self.assertEqual(expected, result)
+
+    def test_should_handle_example_input_correctly(self):
+        # Given
+        string = "3,4,3,1,2"
+
+        # When
+        result = generation_from_string(string)
+
+        # Then
+        expected = [0, 1, 1, 2, 1, 0, 0, 0, 0]
+        self.assertEqual(expected, result)
+
+
+class TestUnlimitedDigits(unittest.TestCase):
+    def test_limit_should_be_lifted_inside_and_restored_after(self):
+        # Given
+        previous = sys.get_int_max_str_digits()
+
+        # When
+        with unlimited_digits():
+            digits = len(str(10 ** (previous + 10)))
+
+        # Then
+        self.assertEqual((previous + 11, previous), (digits, sys.get_int_max_str_digits()))
+
+
+class TestAdvance(unittest.TestCase):
+    def test_example_should_have_example_populations(self):
+        # Given
+        generation = generation_from_string("3,4,3,1,2")
+
+        # When
+        result = [sum(advance(generation, days)) for days in (18, 80, 256)]
+
+        # Then
+        self.assertEqual([26, 5934, 26984457539], result)
+
+    def test_modulus_should_give_population_modulo(self):
+        # Given
+        generation = generation_from_string("3,4,3,1,2")
+
+        # When
+        result = sum(advance(generation, 256, modulus=1000)) % 1000
+
+        # Then
+        self.assertEqual(539, result)
+
+    def test_school_sizes_should_match_advance_for_every_checkpoint(self):
+        # Given
+        schools = [generation_from_string("3,4,3,1,2"), generation_from_string("8,0")]
+
+        # When
+        result = list(school_sizes([256, 18, 0, 80], schools, modulus=10**6))
+
+        # Then
+        expected = [
+            (days, [sum(advance(school, days)) % 10**6 for school in schools])
+            for days in (0, 18, 80, 256)
+        ]
+        self.assertEqual(expected, result)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Usage: table.py [--modulus MODULUS] DAYS... < schools.txt
+
+Stream the size of every school, one line of timers each, after each of DAYS
+days: one row per checkpoint, the days first.
+"""
+
+import argparse
+import sys
+
+from aoc import verbosity
+
+from population import generation_from_string
+from population import school_sizes
+from population import unlimited_digits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sizes of lanternfish schools over time")
+    parser.add_argument("days", type=int, nargs="+", help="checkpoints, in days")
+    parser.add_argument("--modulus", type=int, help="sizes modulo this number")
+    arguments = parser.parse_args()
+
+    schools = [generation_from_string(line) for line in sys.stdin if line.strip()]
+    verbosity.info(f"{len(schools)} schools, {len(arguments.days)} checkpoints")
+
+    with unlimited_digits():
+        for days, sizes in school_sizes(arguments.days, schools, arguments.modulus):
+            print(days, *sizes, flush=True)
+
+
+if __name__ == "__main__":
+    verbosity.parse_arguments()
+    main()
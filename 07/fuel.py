@@ -0,0 +1,278 @@
+"""The fuel it takes the crabs to line up at a position.
+
+The positions are sorted once and summed up in prefix sums of the counts,
+the positions and the squared positions. At any target the crabs to the
+left and to the right are a binary search away, and the sums of their
+distances follow from the prefix sums without visiting a single crab:
+
+    linear:     sum |p - t|
+    triangular: sum |p - t| * (|p - t| + 1) / 2
+              = (sum (p - t) ** 2 + sum |p - t|) / 2
+
+The cheapest target for linear fuel is the median. For triangular fuel it
+is within half a step of the mean, the few positions around it are checked.
+
+Any other convex fuel per distance makes a convex total fuel over the
+targets too. Its cheapest target is found by a golden-section search over
+the range of the positions, every total computed once from a histogram of
+the positions. The whole curve of totals is computed with numpy, for
+plotting.
+"""
+
+import functools
+import itertools
+import math
+import sys
+import unittest
+from bisect import bisect_right
+from collections import Counter
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from aoc import loader
+
+Histogram = Dict[int, int]
+"""The number of crabs at every position."""
+
+DistanceCost = Callable[[int], int]
+"""The fuel to move a distance, convex. Also applied to numpy arrays by cost_curve()."""
+
+CURVE_CHUNK = 1024
+"""Targets priced at a time by cost_curve(), bounding the distance matrix."""
+
+GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+
+
+def steps_for_distance(distance: int) -> int:
+    """Return the cost for distance, one per step."""
+    return distance
+
+
+def cost_for_distance(distance: int) -> int:
+    """Return the calculated cost for distance.
+
+    distance: 1 2 3 4
+    cost:     1 3 5 9
+    """
+
+    return distance * (distance + 1) // 2
+
+
+class Crabs:
+    def __init__(self, positions: List[int]) -> None:
+        self.positions = sorted(positions)
+
+        self.sums = list(itertools.accumulate(self.positions, initial=0))
+        self.squares = list(
+            itertools.accumulate((position * position for position in self.positions), initial=0)
+        )
+
+    @classmethod
+    def from_buffer(cls, buffer: loader.Buffer) -> "Crabs":
+        return cls(loader.integers(buffer).tolist())
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def linear_cost(self, target: int) -> int:
+        """Return the fuel for all crabs to move to target, one per step."""
+        left = bisect_right(self.positions, target)
+        left_sum = self.sums[left]
+        right_sum = self.sums[-1] - left_sum
+
+        return target * left - left_sum + right_sum - target * (len(self) - left)
+
+    def triangular_cost(self, target: int) -> int:
+        """Return the fuel for all crabs to move to target, one more for every step."""
+        squared_distances = (
+            self.squares[-1] - 2 * target * self.sums[-1] + target * target * len(self)
+        )
+
+        return (squared_distances + self.linear_cost(target)) // 2
+
+    def cheapest_linear(self) -> Tuple[int, int]:
+        """Return the leftmost cheapest (target, fuel) for linear fuel, the lower median."""
+        target = self.positions[(len(self) - 1) // 2]
+
+        return target, self.linear_cost(target)
+
+    def cheapest_triangular(self) -> Tuple[int, int]:
+        """Return the leftmost cheapest (target, fuel) for triangular fuel, next to the mean."""
+        mean = self.sums[-1] // len(self)
+        low, high = max(mean - 1, self.positions[0]), min(mean + 2, self.positions[-1])
+
+        return min((self.triangular_cost(target), target) for target in range(low, high + 1))[::-1]
+
+    def histogram(self) -> Histogram:
+        return Counter(self.positions)
+
+
+def golden_section(cost: Callable[[int], int], low: int, high: int) -> Tuple[int, int]:
+    """Return the leftmost cheapest (target, cost) in low..high of a convex cost.
+
+    The bracket shrinks to the side of the cheaper of two inner targets at the
+    golden ratio, the one kept is (about) an inner target of the next bracket
+    too, so a memoised cost is computed about once per step.
+    """
+    while high - low > 2:
+        step = round((high - low) / GOLDEN_RATIO)
+        left, right = high - step, low + step
+        if left >= right:
+            left, right = (low + high) // 2, (low + high) // 2 + 1
+
+        # Convex, so everything up to left costs more than right
+        if cost(left) > cost(right):
+            low = left + 1
+
+        else:
+            high = right
+
+    return min((cost(target), target) for target in range(low, high + 1))[::-1]
+
+
+def total_cost(distance_cost: DistanceCost, histogram: Histogram, target: int) -> int:
+    return sum(
+        count * distance_cost(abs(position - target)) for position, count in histogram.items()
+    )
+
+
+def cheapest(distance_cost: DistanceCost, histogram: Histogram) -> Tuple[int, int]:
+    """Return the leftmost cheapest (target, fuel) for the crabs in histogram."""
+    cost = functools.lru_cache(maxsize=None)(
+        functools.partial(total_cost, distance_cost, histogram)
+    )
+
+    return golden_section(cost, min(histogram), max(histogram))
+
+
+def cost_curve(distance_cost: DistanceCost, histogram: Histogram):
+    """Return arrays of every target in the range of the positions and the fuel to it."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    positions = numpy.fromiter(histogram.keys(), dtype=numpy.int64, count=len(histogram))
+    counts = numpy.fromiter(histogram.values(), dtype=numpy.int64, count=len(histogram))
+
+    targets = numpy.arange(positions.min(), positions.max() + 1)
+    curve = numpy.empty_like(targets)
+    for start in range(0, len(targets), CURVE_CHUNK):
+        chunk = targets[start : start + CURVE_CHUNK]
+        curve[start : start + len(chunk)] = distance_cost(
+            numpy.abs(chunk[:, numpy.newaxis] - positions)
+        ) @ counts
+
+    return targets, curve
+
+
+def print_cost_curve(distance_cost: DistanceCost, histogram: Histogram, file=sys.stdout) -> None:
+    targets, curve = cost_curve(distance_cost, histogram)
+    rows = zip(targets.tolist(), curve.tolist())
+    print("\n".join(f"{target : >4} | {cost}" for target, cost in rows), file=file)
+
+
+class TestCrabs(unittest.TestCase):
+    EXAMPLE = b"16,1,2,0,4,2,7,1,2,14\n"
+
+    def test_example_should_have_example_costs(self):
+        # Given
+        crabs = Crabs.from_buffer(self.EXAMPLE)
+
+        # When
+        result = [crabs.linear_cost(2), crabs.triangular_cost(5), crabs.triangular_cost(2)]
+
+        # Then
+        self.assertEqual([37, 168, 206], result)
+
+    def test_cheapest_should_match_every_position(self):
+        # Given
+        crabs = Crabs([3, 3, 8, 40, 41, 41, 97, 1000, 2, 0, 1])
+        targets = range(crabs.positions[-1] + 1)
+
+        # When
+        result = crabs.cheapest_linear(), crabs.cheapest_triangular()
+
+        # Then
+        expected = (
+            min((crabs.linear_cost(target), target) for target in targets)[::-1],
+            min((crabs.triangular_cost(target), target) for target in targets)[::-1],
+        )
+        self.assertEqual(expected, result)
+
+
+class TestCheapest(unittest.TestCase):
+    def test_cheapest_should_match_cost_curve(self):
+        # Given
+        histogram = Counter([3, 3, 8, 40, 41, 41, 97, 1000, 2, 0, 1, 17, 18, 18])
+
+        # When
+        result = [
+            cheapest(distance_cost, histogram)
+            for distance_cost in (steps_for_distance, cost_for_distance, lambda d: d**3)
+        ]
+
+        # Then
+        expected = []
+        for distance_cost in (steps_for_distance, cost_for_distance, lambda d: d**3):
+            targets, curve = cost_curve(distance_cost, histogram)
+            expected.append((int(targets[curve.argmin()]), int(curve.min())))
+
+        self.assertEqual(expected, result)
+
+
+class TestCostForDistance(unittest.TestCase):
+    def test_0_distance_should_cost_0(self):
+        # Given
+        distance = 0
+
+        # When
+        result = cost_for_distance(distance)
+
+        # Then
+        self.assertEqual(0, result)
+
+    def test_1_distance_should_cost_1(self):
+        # Given
+        distance = 1
+
+        # When
+        result = cost_for_distance(distance)
+
+        # Then
+        self.assertEqual(1, result)
+
+    def test_2_distance_should_cost_3(self):
+        # Given
+        distance = 2
+
+        # When
+        result = cost_for_distance(distance)
+
+        # Then
+        self.assertEqual(3, result)
+
+    def test_example_distances_should_have_correct_cost(self):
+        # Given
+        examples = [
+            #(start, end, cost),
+            (16, 5, 66),
+            (1, 5, 10),
+            (2, 5, 6),
+            (0, 5, 15),
+            (4, 5, 1),
+            (2, 5, 6),
+            (7, 5, 3),
+            (1, 5, 10),
+            (2, 5, 6),
+            (14, 5, 45),
+        ]
+
+        def distance(start, end) -> int:
+            return abs(end - start)
+
+        # When
+        result = [cost_for_distance(distance(start, end)) for start, end, _cost in examples]
+
+        # Then
+        expected = [cost for _start, _end, cost in examples]
+        self.assertEqual(expected, result)
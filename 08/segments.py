@@ -0,0 +1,182 @@
+"""Decode the scrambled seven-segment displays.
+
+Every signal pattern is a 7-bit mask, bit 0 for wire a. A display line is
+decoded into a dict from the masks of its ten patterns to their digits, and
+the output patterns are looked up in it. There are two strategies:
+
+deduce: only 1 and 4 are picked out of the patterns, by their unique
+    segment counts. Every digit has its own segment count and overlaps with
+    1 and 4, so the outputs are decoded when they are looked up.
+table: all 5040 wirings are tried once up front. The set of ten pattern
+    masks is different for every wiring, as one int with a bit per mask it
+    is the key to the decoding of a wiring.
+
+Run as a script to benchmark the strategies.
+"""
+
+import functools
+import itertools
+import sys
+import unittest
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+Decoding = Dict[int, int]
+"""Digit by pattern mask."""
+
+Decoder = Callable[[Sequence[str]], Decoding]
+
+DIGITS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+"""The segments of every digit, wired correctly."""
+
+
+@functools.lru_cache(maxsize=None)
+def mask(pattern: str) -> int:
+    """Return the mask of the segments in pattern, there are 2**7 masks but 13699 patterns."""
+    result = 0
+    for segment in pattern:
+        result |= 1 << (ord(segment) - ord("a"))
+
+    return result
+
+
+def overlaps(mask_: int, one: int, four: int) -> Tuple[int, int, int]:
+    """Return the segment count of mask_ and the counts it shares with the masks of 1 and 4."""
+    return mask_.bit_count(), (mask_ & one).bit_count(), (mask_ & four).bit_count()
+
+
+DIGIT_BY_OVERLAPS = {
+    overlaps(mask(pattern), mask(DIGITS[1]), mask(DIGITS[4])): digit
+    for digit, pattern in enumerate(DIGITS)
+}
+"""Digit by overlaps(), the same for every wiring."""
+
+
+class Deduction(dict):
+    """A decoding that deduces the digit of a mask when it is first looked up."""
+
+    def __init__(self, one: int, four: int) -> None:
+        super().__init__()
+        self.one = one
+        self.four = four
+
+    def __missing__(self, mask_: int) -> int:
+        self[mask_] = digit = DIGIT_BY_OVERLAPS[overlaps(mask_, self.one, self.four)]
+
+        return digit
+
+
+def deduce(patterns: Sequence[str]) -> Decoding:
+    """Return the decoding of the ten patterns of a display, from its 1 and 4."""
+    one = four = 0
+    for pattern in patterns:
+        if len(pattern) == 2:
+            one = mask(pattern)
+
+        elif len(pattern) == 4:
+            four = mask(pattern)
+
+    return Deduction(one, four)
+
+
+def signature(masks: Sequence[int]) -> int:
+    """Return an int with a bit set for every mask, the same for the patterns in any order."""
+    result = 0
+    for mask_ in masks:
+        result |= 1 << mask_
+
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def wirings() -> Dict[int, Decoding]:
+    """Return the decoding of every wiring, by the signature of its patterns."""
+    table = {}
+    for wiring in itertools.permutations("abcdefg"):
+        rewire = str.maketrans("abcdefg", "".join(wiring))
+        masks = [mask(digit.translate(rewire)) for digit in DIGITS]
+        table[signature(masks)] = {mask_: digit for digit, mask_ in enumerate(masks)}
+
+    return table
+
+
+def look_up(patterns: Sequence[str]) -> Decoding:
+    """Return the decoding of the ten patterns of a display, from the table of all wirings."""
+    return wirings()[signature([mask(pattern) for pattern in patterns])]
+
+
+STRATEGIES: Dict[str, Decoder] = {"deduce": deduce, "table": look_up}
+
+
+def line_to_number(line: str, decoder: Decoder = deduce) -> int:
+    """Return the output value of a display line, "<10 patterns> | <4 outputs>"."""
+    signals = line.split()
+    decoding = decoder(signals[:10])
+
+    number = 0
+    for signal in signals[11:]:
+        number = 10 * number + decoding[mask(signal)]
+
+    return number
+
+
+def benchmark(scale: int) -> None:
+    """Print the time of every strategy on a generated input of scale."""
+    # pylint: disable=import-outside-toplevel
+    import random
+    import time
+
+    from aoc.bench import generators
+
+    lines = generators.seven_segment_notes(scale, random.Random(2021)).splitlines()
+    print(f"{len(lines)} lines")
+
+    for name, decoder in STRATEGIES.items():
+        start = time.perf_counter()
+        total = sum(line_to_number(line, decoder) for line in lines)
+        print(f"{name : <6} {time.perf_counter() - start : >8.3f} s  sum {total}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
+
+
+class TestDecoders(unittest.TestCase):
+    LINE = "acedgfb cdfbe gcdfa fbcad dab cefabd cdfgeb eafb cagedb ab | cdfeb fcadb cdfeb cdbaf"
+
+    def test_every_strategy_should_decode_example_line(self):
+        # Given
+        decoders: List[Decoder] = list(STRATEGIES.values())
+
+        # When
+        result = [line_to_number(self.LINE, decoder) for decoder in decoders]
+
+        # Then
+        self.assertEqual([5353] * len(decoders), result)
+
+    def test_deduce_should_decode_every_pattern_like_table(self):
+        # Given
+        patterns = self.LINE.split()[:10]
+
+        # When
+        result = deduce(patterns)
+
+        # Then
+        expected = look_up(patterns)
+        self.assertEqual(expected, {mask_: result[mask_] for mask_ in expected})
+
+
+class TestLineToNumber(unittest.TestCase):
+
+    def test_example_line_1625(self):
+        # Given
+        line = "bdfegc cbegaf gecbf dfcage bdacg ed bedf ced adcbefg gebcd | ed bcgafe cdgba cbgef"
+
+        # When
+        result = line_to_number(line)
+
+        # Then
+        self.assertEqual(1625, result)
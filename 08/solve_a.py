@@ -3,6 +3,8 @@
 
 import sys
 
+from aoc import verbosity
+
 
 def main() -> None:
 
@@ -18,4 +20,5 @@ def main() -> None:
     print(count)
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -0,0 +1,93 @@
+"""Lowpoints and basins of the heightmap, shared by both parts.
+
+The grid is padded with a border of 9s, the highest height. A border cell is
+never lower than its neighbour and a basin ends at it like at any other 9, so
+the four neighbours of every cell are at fixed offsets without bounds checks.
+"""
+
+import unittest
+from typing import List
+from typing import Tuple
+
+from aoc.grid import Grid
+
+WALL = 9
+"""The height that is never part of a basin, and of the border."""
+
+
+def padded(grid: Grid) -> Grid:
+    return grid.padded(1, fill=WALL)
+
+
+def offsets(heightmap: Grid) -> Tuple[int, int, int, int]:
+    """Return the index offsets of the four neighbours in the padded heightmap."""
+    return (-heightmap.width, -1, 1, heightmap.width)
+
+
+def lowpoints(heightmap: Grid) -> List[int]:
+    """Return the indices of the lowpoints of the padded heightmap."""
+    cells, width = heightmap.cells, heightmap.width
+
+    indices = []
+    for row in range(width, len(cells) - width, width):
+        for index in range(row + 1, row + width - 1):
+            value = cells[index]
+            if (
+                value < cells[index - 1]
+                and value < cells[index + 1]
+                and value < cells[index - width]
+                and value < cells[index + width]
+            ):
+                indices.append(index)
+
+    return indices
+
+
+def basin_sizes(heightmap: Grid) -> List[int]:
+    """Return the size of the basin of every lowpoint of the padded heightmap.
+
+    Visited cells are shared by all basins, a basin with several lowpoints
+    is only counted from the first one.
+    """
+    cells = heightmap.cells
+    neighbours = offsets(heightmap)
+
+    sizes = []
+    visited = bytearray(len(cells))
+    for lowpoint in lowpoints(heightmap):
+        if visited[lowpoint]:
+            continue
+
+        visited[lowpoint] = 1
+        to_visit = [lowpoint]
+        size = 0
+        while to_visit:
+            index = to_visit.pop()
+            size += 1
+
+            for offset in neighbours:
+                neighbour = index + offset
+                if not visited[neighbour] and cells[neighbour] != WALL:
+                    visited[neighbour] = 1
+                    to_visit.append(neighbour)
+
+        sizes.append(size)
+
+    return sizes
+
+
+class TestHeightmap(unittest.TestCase):
+    EXAMPLE = b"2199943210\n3987894921\n9856789892\n8767896789\n9899965678\n"
+
+    def test_example_should_have_example_lowpoints_and_basins(self):
+        # Given
+        heightmap = padded(Grid.from_buffer(self.EXAMPLE))
+
+        # When
+        result = (
+            sum(heightmap[index] + 1 for index in lowpoints(heightmap)),
+            sorted(basin_sizes(heightmap)),
+        )
+
+        # Then
+        self.assertEqual((15, [3, 9, 9, 14]), result)
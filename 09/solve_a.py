@@ -1,52 +1,23 @@
 #!/usr/bin/env python3
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 
-import sys
-from typing import List
-from pprint import pprint
+from aoc import loader
+from aoc import verbosity
+from aoc.grid import Grid
 
-
-class Board:
-    def __init__(self, board: str):
-        self.board = board.strip().split("\n")
-
-        self.max_y = len(self.board) - 1
-        self.max_x = len(self.board[0]) - 1
-
-        print(self.max_x, self.max_y)
-
-    def is_lowpoint(self, x: int, y: int) -> bool:
-        value = self.board[y][x]
-
-        return all((
-            y == 0 or (value < self.board[y - 1][x]),  # North
-            y == self.max_y or (value < self.board[y + 1][x]),  # South
-            x == 0 or (value < self.board[y][x - 1]),  # West
-            x == self.max_x or (value < self.board[y][x + 1]),  # East
-            ))
-
-    def lowpoints(self) -> List[int]:
-        """Return the risk levels for the lowpoints."""
-
-        return [
-            int(self.board[y][x]) + 1
-            for x in range(self.max_x + 1)
-            for y in range(self.max_y + 1)
-            if self.is_lowpoint(x, y)
-        ]
-
-    def __str__(self) -> str:
-        return "\n".join(self.board)
+from heightmap import lowpoints
+from heightmap import padded
 
 
 def main() -> None:
-    board_data = sys.stdin.read()
+    grid = Grid.from_buffer(loader.read_input())
+    verbosity.info(grid.width - 1, grid.height - 1)
+    verbosity.trace(grid)
 
-    board = Board(board_data)
-    print(board)
-    lowpoints = board.lowpoints()
-    print(sum(lowpoints))
+    heightmap = padded(grid)
+    print(sum(heightmap[index] + 1 for index in lowpoints(heightmap)))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
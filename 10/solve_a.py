@@ -3,6 +3,8 @@
 import sys
 from typing import List
 
+from aoc import verbosity
+
 
 def validate_line(line: str) -> int:
     """Return score/error code for line.
@@ -38,4 +40,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -4,6 +4,8 @@ import sys
 from typing import List
 from functools import reduce
 
+from aoc import verbosity
+
 
 def validate_line(line: str) -> int:
     """Return score/error code for line.
@@ -40,4 +42,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -1,55 +1,60 @@
 #!/usr/bin/env python3
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
-import itertools
-import sys
-from typing import List, Tuple, Optional
+from typing import List, Optional
 
-Board = List[List[int]]
-Position = Tuple[int, int]
+from aoc import loader
+from aoc import verbosity
+from aoc.grid import Grid
 
 
-def next_step(board: Board) -> Board:
-    next_board = [[n + 1 for n in line] for line in board]
-    return next_board
+def next_step(board: Grid) -> List[int]:
+    """Increase all energy-levels and return the positions about to flash."""
+    cells = board.cells
+    for index in range(len(cells)):
+        cells[index] += 1
 
+    return [index for index, value in enumerate(cells) if value > 9]
 
-def flash(x: int, y: int, board: Board):
-    """Change the board only to increase the energy-levels correrctly."""
 
-    flashed_area = filter(
-        (lambda pos: pos[0] != x or pos[1] != y),
-        itertools.product(
-            range(max(0, x - 1), min(x + 2, len(board[0]))),
-            range(max(0, y - 1), min(y + 2, len(board))),
-        ),
-    )
-    for pos_x, pos_y in flashed_area:
-        value = board[pos_y][pos_x]
-        if value is not None:
-            board[pos_y][pos_x] = value + 1
+def flash(flash_positions: List[int], board: Grid) -> int:
+    """Change the board only to increase the energy-levels correrctly.
+
+    Return the number of flashes, a flashed octopus keeps a level above 9 until
+    the board is reset.
+    """
+    cells = board.cells
+    neighbours = board.surrounding
+    flash_count = 0
+
+    while flash_positions:
+        index = flash_positions.pop()
+        flash_count += 1
+
+        for neighbour in neighbours[index]:
+            cells[neighbour] += 1
+            if cells[neighbour] == 10:
+                flash_positions.append(neighbour)
 
-    board[y][x] = None
+    return flash_count
 
 
-def flashes_on_board(board: Board) -> List[Position]:
-    width = len(board[0])
-    height = len(board)
+def reset(board: Grid) -> None:
+    cells = board.cells
+    for index, value in enumerate(cells):
+        if value > 9:
+            cells[index] = 0
 
-    return [
-        (x, y)
-        for x, y, in itertools.product(range(width), range(height))
-        if board[y][x] and board[y][x] > 9
-    ]
 
+def print_board(board: Grid, turn: Optional[int] = None) -> None:
+    if not verbosity.enabled(verbosity.TRACE):
+        return
 
-def print_board(board: Board, turn: Optional[int] = None) -> None:
-    return
     turn = "" if turn is None else turn
     print(f"\u250C\u2508\u2508{turn :^27}\u2508\u2508\u2510")
     print(
         "\u2502 "
         + " \u2502\n\u2502 ".join(
-            " ".join(f"{'' if n is None else n : >2}" for n in line) for line in board
+            " ".join(f"{'' if n > 9 else n : >2}" for n in line) for line in board.rows()
         )
         + " \u2502"
     )
@@ -57,7 +62,7 @@ def print_board(board: Board, turn: Optional[int] = None) -> None:
 
 
 def main() -> None:
-    board = [[int(n) for n in line.strip()] for line in sys.stdin]
+    board = Grid.from_buffer(loader.read_input())
 
     turns = 300
 
@@ -66,25 +71,24 @@ def main() -> None:
     print_board(board, 0)
 
     for turn in range(1, turns + 1):
-        board = next_step(board)
+        flash_positions = next_step(board)
         print_board(board, str(turn) + "s")
-        while flash_positions := flashes_on_board(board):
-            for x, y in flash_positions:
-                flash(x, y, board)
-                flash_count += 1
+        step_flash_count = flash(flash_positions, board)
+        flash_count += step_flash_count
 
         print_board(board, str(turn) + "e")
 
-        if all(p is None for p in itertools.chain.from_iterable(board)):
+        if step_flash_count == len(board):
             break
 
-        board = [[0 if v is None else v for v in line] for line in board]
+        reset(board)
 
         print_board(board, str(turn) + "z")
 
-    print(flash_count)
+    verbosity.info(flash_count)
     print(turn)
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
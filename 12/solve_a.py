@@ -2,9 +2,11 @@
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 import sys
 from collections import defaultdict
-from pprint import pprint
+from pprint import pformat
 from typing import Dict, List
 
+from aoc import verbosity
+
 Graph = Dict[str, List[str]]
 
 
@@ -15,7 +17,8 @@ def is_big_cave(name: str) -> bool:
 def explore(
     node_name: str, graph: Graph, visited_nodes: frozenset = frozenset(), level: int = 0,
 ) -> int:
-    print(f"{'  ' * level} {node_name}")
+    if verbosity.enabled(verbosity.TRACE):
+        print("  " * level, node_name)
 
     if node_name == "end":
         return 1
@@ -40,9 +43,10 @@ def main() -> None:
         graph[start].append(end)
         graph[end].append(start)
 
-    pprint(graph)
+    verbosity.info(pformat(graph))
     print(explore("start", graph=graph))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -2,9 +2,11 @@
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 import sys
 from collections import defaultdict
-from pprint import pprint
+from pprint import pformat
 from typing import Dict, List, Hashable, Iterable
 
+from aoc import verbosity
+
 Graph = Dict[str, List[str]]
 
 
@@ -39,7 +41,8 @@ def explore(
     visited_nodes: SpecialSet = SpecialSet(),
     level: int = 0,
 ) -> int:
-    print(f"{'  ' * level} {node_name}")
+    if verbosity.enabled(verbosity.TRACE):
+        print("  " * level, node_name)
 
     if node_name == "end":
         return 1
@@ -69,9 +72,10 @@ def main() -> None:
         graph[start].append(end)
         graph[end].append(start)
 
-    pprint(graph)
-    print(explore("start", graph=graph), file=sys.stderr)
+    verbosity.info(pformat(graph))
+    print(explore("start", graph=graph))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -9,6 +9,9 @@ from functools import reduce
 from pprint import pprint
 from typing import List, Tuple
 
+from aoc import verbosity
+from aoc.grid import grid_from_dots
+
 # f - (x - f) = f - x + f = 2f - x
 
 Dot = Tuple[int, int]
@@ -25,13 +28,10 @@ def max_tuple_values(acc: Dot, dot: Dot) -> Dot:
 def print_paper(paper: Paper) -> None:
     (max_x, max_y) = reduce(max_tuple_values, paper)
 
-    dot_lookup = frozenset(paper)
+    grid = grid_from_dots(paper, width=max_x + 1, height=max_y + 1)
 
     print("\u2508" * (max_x + 1))
-    for y in range(max_y + 1):
-        for x in range(max_x + 1):
-            print('#' if (x, y) in dot_lookup else ' ', end='')
-        print()
+    print(grid.render(lambda value: '#' if value else ' '))
 
 
 def fold_along_y(x: int, y: int, fold: int) -> Paper:
@@ -63,16 +63,17 @@ def main() -> None:
     }
 
     for instruction in instructions.strip().split("\n"):
-        print(repr(instruction))
+        verbosity.info(repr(instruction))
         handler_name, fold = instruction.split("=")
         handler = handlers[handler_name]
 
         dots = list(set(handler(x, y, int(fold)) for x, y in dots))
 
-        print(len(dots))
+        verbosity.info(len(dots))
 
     print_paper(dots)
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -2,18 +2,20 @@
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 """Perform 10 rounds of insertion."""
 
-import sys
 from collections import defaultdict
 
+from aoc import loader
+from aoc import verbosity
+
 
 def main() -> None:
-    template, rule_lines = sys.stdin.read().strip().split("\n\n")
+    template, rule_lines = loader.blocks(loader.read_input())
     rules = {
         key: value
         for key, value in map(lambda s: s.split(" -> "), rule_lines.split("\n"))
     }
 
-    print(template)
+    verbosity.info(template)
     polymer = list(template)
 
     for _round in range(10):
@@ -35,8 +37,10 @@ def main() -> None:
     max_count = max(element_count.values())
     min_count = min(element_count.values())
 
-    print(f"{max_count : 5} | {min_count : 5} | {max_count - min_count : 5}")
+    verbosity.info(f"{max_count : 5} | {min_count : 5} | {max_count - min_count : 5}")
+    print(max_count - min_count)
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
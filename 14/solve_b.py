@@ -16,10 +16,18 @@ from collections import defaultdict
 from pprint import pprint
 from typing import Dict, Iterable, List, TypeVar, Tuple
 
+from aoc import loader
+from aoc import verbosity
+
 T = TypeVar("T")
 
 
 def progress(iterable: Iterable[T]) -> Iterable[T]:
+    if not verbosity.enabled(verbosity.TRACE):
+        yield from iterable
+
+        return
+
     start = datetime.now()
     for element in iterable:
         print((datetime.now() - start), file=sys.stderr)
@@ -76,14 +84,14 @@ def evolve(polymer: Iterable[str], steps: int = 1) -> List[int]:
     iterator = iter(polymer)
     first = next(iterator)
     result[c_to_i(first)] += 1
-    print(first)
+    verbosity.trace(first)
     for second in progress(iterator):
         result[c_to_i(second)] += 1
 
         sub_tree = expand(first, second, steps=steps)
         result = list(map(sum, zip(result, sub_tree)))
 
-        print(second)
+        verbosity.trace(second)
         first = second
 
     return result
@@ -100,23 +108,28 @@ def print_element_count(element_count: List[int]) -> None:
 def main() -> None:
     global RULES
 
-    template, rule_lines = sys.stdin.read().strip().split("\n\n")
+    template, rule_lines = loader.blocks(loader.read_input())
     RULES = {
         key: value
         for key, value in map(lambda s: s.split(" -> "), rule_lines.split("\n"))
     }
 
-    print(template)
+    verbosity.info(template)
     polymer = list(template)
 
     element_count = evolve(polymer=polymer, steps=40)
-    print_element_count(element_count)
+    if verbosity.enabled(verbosity.INFO):
+        print_element_count(element_count)
 
     max_count = max(element_count)
     min_count = min(filter(None, element_count))
 
-    print(f"{max_count : 5} | {min_count : 5} | {max_count - min_count : 5} | ({len(COMPUTE_CACHE)})")
+    verbosity.info(
+        f"{max_count : 5} | {min_count : 5} | {max_count - min_count : 5} | ({len(COMPUTE_CACHE)})"
+    )
+    print(max_count - min_count)
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
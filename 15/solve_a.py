@@ -1,31 +1,29 @@
 #!/usr/bin/env python3
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 
-import itertools
-import sys
-from typing import Dict, List, Tuple, Optional, FrozenSet
+from typing import Dict, FrozenSet, Tuple
 
-Position = Tuple[int, int]
-Board = List[str]
+from aoc import loader
+from aoc import verbosity
+from aoc.grid import Grid
 
 
-COMPUTE_CACHE: Dict[Tuple[int, int], int] = {}
+COMPUTE_CACHE: Dict[int, int] = {}
 """Lowest cost to reach position currently."""
 
+STEPS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+"""Towards the goal first, to find a low risk early."""
+
 
 def explore(
-    board: Board,
-    position: Position,
-    visited: FrozenSet[Position] = frozenset(),
+    board: Grid,
+    steps: Tuple[Tuple[int, ...], ...],
+    position: int,
+    visited: FrozenSet[int] = frozenset(),
     current_risk=0,
     currently_lowest=9e999,
 ) -> int:
-    """Return the lowest risk to goal for position."""
-
-    max_y = len(board) - 1
-    max_x = len(board[0]) - 1
-
-    current_x, current_y = position
+    """Return the lowest risk to goal for position, steps is board.table(STEPS)."""
 
     #print(position, currently_lowest, current_risk, visited)
 
@@ -40,32 +38,22 @@ def explore(
     else:
         COMPUTE_CACHE[position] = current_risk
 
-    if position == (max_x, max_y):
-        print("New lowest risk:", current_risk)
+    if position == len(board) - 1:
+        verbosity.trace("New lowest risk:", current_risk)
 
         return current_risk
 
     visited = visited | frozenset((position,))
 
-    for step_x, step_y in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-        next_x = current_x + step_x
-        next_y = current_y + step_y
-
-        next_position = (next_x, next_y)
-
-        if all(
-            (
-                next_x in range(max_x + 1),
-                next_y in range(max_y + 1),
-                next_position not in visited,
-            )
-        ):
+    for next_position in steps[position]:
+        if next_position not in visited:
 
             score = explore(
                 board=board,
+                steps=steps,
                 position=next_position,
                 visited=visited,
-                current_risk=current_risk + board[next_y][next_x],
+                current_risk=current_risk + board[next_position],
                 currently_lowest=currently_lowest,
             )
 
@@ -76,23 +64,15 @@ def explore(
     return currently_lowest
 
 
-def dijkstra(board: Board) -> int:
-
-    width = len(board[0])
-    height = len(board)
-
-    remaining = [(x, y) for x, y in itertools.product(range(width), range(height))]
-
-
 def main() -> None:
-    board = [[int(v) for v in line] for line in sys.stdin.read().strip().split("\n")]
+    board = Grid.from_buffer(loader.read_input())
 
-    if len(board) < 20:
-        from pprint import pprint
-        pprint(board)
+    if board.height < 20:
+        verbosity.trace(board)
 
-    print(explore(board=board, position=(0, 0)))
+    print(explore(board=board, steps=board.table(STEPS), position=0))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -1,112 +1,30 @@
 #!/usr/bin/env python3
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 
-import itertools
-import queue
-import sys
-from collections import defaultdict
-from dataclasses import dataclass
-from datetime import datetime
-from datetime import timedelta
+import heapq
 from math import inf
-from typing import DefaultDict
-from typing import Dict
-from typing import FrozenSet
-from typing import Iterable
-from typing import List
-from typing import Optional
-from typing import Tuple
 
-WORK_LOG = []
-CURRENTLY_LOWEST = 9e999
+from aoc import loader
+from aoc import verbosity
+from aoc.grid import Grid
 
-COMPUTE_CACHE: Dict[Tuple[int, int], int] = {}
-"""Lowest cost to reach position currently."""
 
-BOARD = None
-TARGET = None
+def wrapped_risk(risk: int, column: int, row: int) -> int:
+    """Return the risk in the tile at (column, row), risks above 9 wrap around to 1."""
+    return (risk - 1 + column + row) % 9 + 1
 
 
-@dataclass
-class Position:
-    x: int
-    y: int
+def dijkstra(board: Grid, start: int, target: int) -> int:
+    shortest_paths = [inf] * len(board)
+    shortest_paths[start] = 0
 
-    def __add__(self, other: "Position") -> "Position":
-        return Position(x=self.x + other.x, y=self.y + other.y)
+    cells = board.cells
+    neighbours = board.orthogonal
 
-    def __hash__(self):
-        return hash((self.x, self.y))
+    heap = [(0, start)]
 
-    def __str__(self) -> str:
-
-        return f"<{self.x},{self.y}>"
-
-    def __cmp__(self, other):
-        return (self.x, self.y).__cmp__((other.x, other.y))
-
-    def __lt__(self, other) -> bool:
-        return (self.x, self.y) < (other.x, other.y)
-
-
-class Board:
-
-    def __init__(self, data: str, wraps: int = 5) -> None:
-        self.board = [[int(v) - 1 for v in line] for line in data.strip().split("\n")]
-
-        self.width = len(self.board[0])
-        self.height = len(self.board)
-
-        self.wraps = wraps
-
-
-    def __len__(self) -> int:
-        return self.width * self.height * self.wraps * self.wraps
-
-    def __getitem__(self, key: Position) -> int:
-        value = self.board[key.y % self.height][key.x % self.width]
-
-        value = (value + key.x // self.width + key.y // self.height) % 9 + 1
-
-        return value
-
-    def __contains__(self, item: Position) -> bool:
-
-        return item.x in range(self.width * self.wraps + 1) and item.y in range(self.height * self.wraps + 1)
-
-    def maxposition(self) -> "Position":
-
-        return Position(x=self.wraps * self.width - 1, y=self.wraps * self.height - 1)
-
-    def naive_cost(self) -> int:
-        return (sum(self[Position(x, 0)] for x in range(1, self.width * self.wraps))
-                + sum(self[Position(0, y)] for y in range(1, self.height * self.wraps)))
-
-    def adjacent(self, position: Position) -> Iterable[Position]:
-        """Return iterable for adjacent nodes."""
-
-        return [position + Position(*p)
-                for p in [(1, 0), (0, 1), (-1, 0), (0, -1)]
-                if position + Position(*p) in self]
-
-
-def dijkstra(board: Board, start: Position, target: Position) -> int:
-    shortest_paths = defaultdict(
-        lambda : inf,
-        {
-            start: 0,
-        },
-    )
-
-    job_target = len(board)
-    job_count = 0
-
-    heap = queue.PriorityQueue()
-    heap.put((0, start))
-
-    while job := heap.get():
-        cost, position = job
-        job_count += 1
+    while heap:
+        cost, position = heapq.heappop(heap)
 
         if position == target:
 
@@ -116,21 +34,22 @@ def dijkstra(board: Board, start: Position, target: Position) -> int:
 
             continue
 
-        for neighbour in board.adjacent(position):
-            this_path_cost = cost + board[neighbour]
+        for neighbour in neighbours[position]:
+            this_path_cost = cost + cells[neighbour]
 
             if this_path_cost < shortest_paths[neighbour]:
-                heap.put((this_path_cost, neighbour))
+                heapq.heappush(heap, (this_path_cost, neighbour))
                 shortest_paths[neighbour] = this_path_cost
 
     return -1
 
 
 def main() -> None:
-    board = Board(sys.stdin.read().strip())
+    board = Grid.from_buffer(loader.read_input()).tiled(5, 5, wrapped_risk)
 
-    print(dijkstra(board, start=Position(0, 0), target=board.maxposition()))
+    print(dijkstra(board, start=0, target=len(board) - 1))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
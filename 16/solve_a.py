@@ -18,6 +18,8 @@ import sys
 from itertools import islice
 from typing import Iterable
 
+from aoc import verbosity
+
 
 def ascii_hex_to_bin(hex_byte: str) -> str:
     return "{0:#06b}".format(int(hex_byte, base=16))[2:]
@@ -42,23 +44,23 @@ LITERAL_VALUE_TYPE_ID = 0x4
 
 def next_packet(data: Iterable[str]):
     version = iterable_bin_to_int(data, 3)
-    print("Version:", version)
+    verbosity.trace("Version:", version)
 
     packet_type_id = iterable_bin_to_int(data, 3)
     is_literal = packet_type_id == LITERAL_VALUE_TYPE_ID
-    print("Type ID:", packet_type_id, 'literal' if is_literal else 'operator')
+    verbosity.trace("Type ID:", packet_type_id, 'literal' if is_literal else 'operator')
 
     if not is_literal:
         length_type_id = iterable_bin_to_int(data, 1)
-        print("Length: ", length_type_id, 'subpackets' if length_type_id else 'bits')
+        verbosity.trace("Length: ", length_type_id, 'subpackets' if length_type_id else 'bits')
 
         if length_type_id:
             subpacket_count = iterable_bin_to_int(data, 11)
-            print("Packets:", subpacket_count)
+            verbosity.trace("Packets:", subpacket_count)
 
         else:
             bit_count = iterable_bin_to_int(data, 15)
-            print("Bits:   ", bit_count)
+            verbosity.trace("Bits:   ", bit_count)
 
     else:
         value = 0
@@ -67,7 +69,7 @@ def next_packet(data: Iterable[str]):
 
         # Get the last packet of bits
         value = (value << 4) + iterable_bin_to_int(data, 4)
-        print("Value:  ", value)
+        verbosity.trace("Value:  ", value)
 
 
     return (version, packet_type_id)
@@ -77,11 +79,18 @@ def main() -> None:
     data = hex_strings_as_binary(sys.stdin)
 
     version_sum = 0
-    while packet := next_packet(data):
-        version_sum += packet[0]
-        print("SUBTOTAL:", version_sum)
-        print("-" * 80)
+    try:
+        while packet := next_packet(data):
+            version_sum += packet[0]
+            verbosity.info("SUBTOTAL:", version_sum)
+            verbosity.trace("-" * 80)
+
+    except ValueError:  # Only the zero padding at the end of the transmission is left
+        pass
+
+    print(version_sum)
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -24,6 +24,8 @@ from itertools import islice
 from typing import Iterable
 from pprint import pprint
 
+from aoc import verbosity
+
 
 def ascii_hex_to_bin(hex_byte: str) -> str:
     return "{0:#06b}".format(int(hex_byte, base=16))[2:]
@@ -52,7 +54,8 @@ TYPE_ID_LITERAL_VALUE = 0x4
 
 
 def log(*message, parselevel, output=sys.stderr):
-    print("| " * parselevel, *message, file=output)
+    if verbosity.enabled(verbosity.TRACE):
+        print("| " * parselevel, *message, file=output)
 
 
 def as_packets(data: Iterable[str], packetlimit=None, parselevel=0):
@@ -175,9 +178,11 @@ def main() -> None:
     data = hex_strings_as_binary(sys.stdin)
 
     for packet in as_packets(data):
-        pprint(packet_to_expression(packet))
+        if verbosity.enabled(verbosity.INFO):
+            pprint(packet_to_expression(packet))
         print(evaluate_packet(packet))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 
-import sys
+from aoc import loader
+from aoc import verbosity
+
+from target import parse
+
 
 def main() -> None:
-    target_bottom = int(sys.argv[1])
+    _target_x, target_y = parse(loader.read_input())
+    target_bottom = target_y.start
 
     # Only works if target is below submarine
     max_speed = abs(target_bottom) - 1
-    print("max speed", max_speed)
+    verbosity.info("max speed", max_speed)
 
     speed = max_speed
     max_height = 0
@@ -20,4 +25,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -2,17 +2,15 @@
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 
 import itertools
-import sys
 
-TARGET = (
-    (20, 30),
-    (-10, -5),
-)
+from aoc import loader
+from aoc import verbosity
+
+from target import parse
 
 
 def main() -> None:
-    target_x = range(TARGET[0][0], TARGET[0][1] + 1)
-    target_y = range(TARGET[1][0], TARGET[1][1] + 1)
+    target_x, target_y = parse(loader.read_input())
 
     # Only works if target is below submarine
     max_speed_y = abs(target_y.start) - 1
@@ -41,11 +39,12 @@ def main() -> None:
             if speed_x:
                 speed_x -= 1
 
-            elif pos_x < TARGET[0][0]:
+            elif pos_x < target_x.start:
 
                 break
 
     print(target_speed_count)
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -0,0 +1,29 @@
+"""The target area of the probe, shared by both parts.
+
+The input is a single line like `target area: x=20..30, y=-10..-5`.
+"""
+
+import re
+import unittest
+from typing import Tuple
+
+from aoc import loader
+
+
+def parse(buffer: loader.Buffer) -> Tuple[range, range]:
+    """Return the x and y ranges of the target area, both inclusive of their ends."""
+    x_min, x_max, y_min, y_max = (int(value) for value in re.findall(rb"-?\d+", buffer))
+
+    return range(x_min, x_max + 1), range(y_min, y_max + 1)
+
+
+class TestTarget(unittest.TestCase):
+    def test_example_should_have_inclusive_ranges(self):
+        # Given
+        buffer = b"target area: x=20..30, y=-10..-5\n"
+
+        # When
+        result = parse(buffer)
+
+        # Then
+        self.assertEqual((range(20, 31), range(-10, -4)), result)
@@ -2,31 +2,34 @@
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 
 import math
-import sys
 import unittest
 from typing import Tuple, Union
 
+from aoc import loader
+from aoc import verbosity
+
 from snailfish_numbers import number_from_string, add, reduce, magnitude
 
 
 def main() -> None:
-    numbers = map(number_from_string, sys.stdin.readlines())
+    numbers = map(number_from_string, loader.lines(loader.read_input()))
     
     result = next(numbers)
     result = reduce(result)
 
     for i, number in enumerate(numbers):
-        print(i, number)
+        verbosity.trace(i, number)
 
         result = add(result, number)
-        print(i, result)
+        verbosity.trace(i, result)
 
         result = reduce(result)
-        print(i, result)
+        verbosity.trace(i, result)
 
-    print(result)
+    verbosity.info(result)
     print(magnitude(result))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
\ No newline at end of file
@@ -2,13 +2,15 @@
 # pylint: disable=missing-function-docstring, missing-class-docstring, missing-module-docstring
 
 import itertools
-import sys
+
+from aoc import loader
+from aoc import verbosity
 
 from snailfish_numbers import number_from_string, add, reduce, magnitude
 
 
 def main() -> None:
-    numbers = list(map(number_from_string, sys.stdin.readlines()))
+    numbers = list(map(number_from_string, loader.lines(loader.read_input())))
 
     
     max_sum = 0
@@ -25,4 +27,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
\ No newline at end of file
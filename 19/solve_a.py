@@ -8,8 +8,7 @@ from math import cos, sin, pi
 
 import numpy
 
-# from matplotlib import pyplot as plot
-from tqdm import tqdm
+from aoc import verbosity
 
 
 def log_progress(file_name: str, scanner: int, translation, offset) -> None:
@@ -21,7 +20,7 @@ def log_progress(file_name: str, scanner: int, translation, offset) -> None:
 
 
 def iterate_progress_cache(filename: str):
-    print("Read from cache")
+    verbosity.info("Read from cache")
     if not os.path.exists(filename):
         return
 
@@ -32,10 +31,10 @@ def iterate_progress_cache(filename: str):
             translation = numpy.array(translation_data.split(","), numpy.int32).reshape(
                 (3, 3)
             )
-            print(scanner_index, offset)
+            verbosity.info(scanner_index, offset)
             yield (int(scanner_index), offset, translation)
 
-    print("--- Cache done")
+    verbosity.info("--- Cache done")
     return
 
 
@@ -171,7 +170,7 @@ def main() -> None:
 
             description = f"U:{len(universe) : >2} | P:{len(scanners_to_place) : >2} | S:{number + 1 : >2} |"
             # For all possible axis-rotations
-            with tqdm(desc=description, total=24) as progress_bar:
+            with verbosity.progress(description, total=24) as progress_bar:
                 for rotation, facing in itertools.product(rotations, facings):
                     progress_bar.update(1)
 
@@ -209,7 +208,7 @@ def main() -> None:
                                     translation=translation,
                                     offset=offset,
                                 )
-                                print("   Placed scanner:", offset, common_points_count)
+                                verbosity.info("   Placed scanner:", offset, common_points_count)
 
                                 universe.append(
                                     (
@@ -240,14 +239,17 @@ def main() -> None:
         *(beacon_data for beacon_data, _rotation, _offset, _split_indices in universe)
     )
     unique_beacons = {tuple(beacon) for beacon in all_beacons}
-    print(f"----------------------------------- {len(unique_beacons) : >5} beacons")
-    scanner_positions = [offset for _, _, offset, _ in universe]
+    verbosity.info(f"----------------------------------- {len(unique_beacons) : >5} beacons")
 
-    max_distance = max(
-        numpy.absolute(a - b).sum()
-        for a, b in itertools.product(scanner_positions, scanner_positions)
-    )
-    print(f"----------------------------------- {max_distance : >5} distance")
+    if verbosity.enabled(verbosity.INFO):
+        scanner_positions = [offset for _, _, offset, _ in universe]
+        max_distance = max(
+            numpy.absolute(a - b).sum()
+            for a, b in itertools.product(scanner_positions, scanner_positions)
+        )
+        print(f"----------------------------------- {max_distance : >5} distance")
+
+    print(len(unique_beacons))
 
     # figure = plot.figure()
     # axis = plot.axes(projection="3d")
@@ -259,4 +261,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -0,0 +1,28 @@
+"""The starting positions of the players, shared by both parts.
+
+The input has a line like `Player 1 starting position: 4` for every player.
+"""
+
+import unittest
+from typing import Tuple
+
+from aoc import loader
+
+
+def starting_positions(buffer: loader.Buffer) -> Tuple[int, ...]:
+    """Return the starting positions of the players, counted from 0."""
+    return tuple(
+        int(line.rpartition(":")[2]) - 1 for line in loader.lines(buffer) if line.strip()
+    )
+
+
+class TestPlayers(unittest.TestCase):
+    def test_example_should_start_from_0(self):
+        # Given
+        buffer = b"Player 1 starting position: 4\nPlayer 2 starting position: 8\n"
+
+        # When
+        result = starting_positions(buffer)
+
+        # Then
+        self.assertEqual((3, 7), result)
@@ -3,6 +3,11 @@
 
 from itertools import repeat, islice
 
+from aoc import loader
+from aoc import verbosity
+
+from players import starting_positions
+
 
 def deterministic_die(N):
     while True:
@@ -10,10 +15,9 @@ def deterministic_die(N):
 
 
 def main() -> None:
-    player_count = 2
+    player_positions = list(starting_positions(loader.read_input()))
+    player_count = len(player_positions)
     scores = [0] * player_count
-    player_positions = [0] * player_count
-    player_positions = [4-1, 7-1]
 
     die = deterministic_die(100)
 
@@ -33,7 +37,8 @@ def main() -> None:
             # Update scores
             scores[player] += player_positions[player] + 1
 
-            print(f"{player} | p:{player_positions[player]+1 : >2} | s:{scores[player] : >3}")
+            if verbosity.enabled(verbosity.TRACE):
+                print(f"{player} | p:{player_positions[player]+1 : >2} | s:{scores[player] : >3}")
 
             if scores[player] >= 1000:
                 break
@@ -43,8 +48,10 @@ def main() -> None:
 
         break
     
-    print(scores[(player + 1) % 2], roll_count, scores[(player + 1) % 2] * roll_count)
+    verbosity.info(scores[(player + 1) % 2], roll_count)
+    print(scores[(player + 1) % 2] * roll_count)
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
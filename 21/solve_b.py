@@ -4,6 +4,11 @@
 from itertools import repeat, islice
 from typing import Tuple
 
+from aoc import loader
+from aoc import verbosity
+
+from players import starting_positions
+
 COMPUTE_CACHE = {}
 
 
@@ -55,10 +60,11 @@ def dirac_round(player=0, positions=(0, 0), scores=(0, 0)) -> Tuple[int, int]:
 
 def main() -> None:
 
-    wins = dirac_round(positions=(4 - 1, 8 - 1))
-    print(wins, max(wins))
-    print(len(COMPUTE_CACHE))
+    wins = dirac_round(positions=starting_positions(loader.read_input()))
+    verbosity.info(wins, len(COMPUTE_CACHE))
+    print(max(wins))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
-import sys
 import itertools
 from typing import Iterator, Tuple
 
+from aoc import loader
+from aoc import verbosity
+
 Position = Tuple[int, int, int]
 
 MIN = -50
@@ -24,7 +26,7 @@ def main() -> None:
 
     on = set()
 
-    for line in sys.stdin.readlines():
+    for line in loader.lines(loader.read_input()):
         operation, coordinates = line.strip().split(" ")
         start, stop = zip(
             *(
@@ -32,14 +34,17 @@ def main() -> None:
                 for axis_range in coordinates.split(",")
             )
         )
-        print(start, stop)
+        verbosity.trace(start, stop)
         operation_method = on.update if operation == "on" else on.difference_update
         operation_method(cuboid(start, stop))
 
-        print(len(on))
+        verbosity.trace(len(on))
+
+    print(len(on))
 
     ##pprint(list(cuboid((0,0,0), (1,1,1))))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -1,16 +1,13 @@
 #!/usr/bin/env python3
 
 import math
-import sys
 import itertools
 import unittest
 from dataclasses import dataclass
 from typing import Iterator, Tuple, Optional, Iterable
 
-try:
-    from matplotlib import pyplot
-except ImportError:
-    pyplot = None
+from aoc import loader
+from aoc import verbosity
 
 
 @dataclass(frozen=True)
@@ -147,7 +144,15 @@ class Cuboid:
 
 
 def plot_cubes(cubes: Iterable) -> None:
-    if pyplot is None:
+    """Show the cubes in 3D, if matplotlib is installed.
+
+    matplotlib is imported here since it takes longer to import than most
+    days take to run.
+    """
+    try:
+        from matplotlib import pyplot  # pylint: disable=import-outside-toplevel
+
+    except ImportError:
         return
 
     figure = pyplot.figure()
@@ -171,7 +176,7 @@ def main() -> None:
     from pprint import pprint
 
     cubes = []
-    for line in sys.stdin.readlines():
+    for line in loader.lines(loader.read_input()):
         operation, coordinates = line.strip().split(" ")
         operation_cubes = [Cuboid(
             *(
@@ -188,6 +193,10 @@ def main() -> None:
                     )
                 )
 
+                if not verbosity.enabled(verbosity.TRACE):
+                    continue
+
+                # Sanity checks of the cut algorithm, these are O(n^2)
                 overlapping = [(a, b) for a, b in itertools.combinations(operation_cubes, 2) if a.touches(b)]
                 if any(a in b for a, b in itertools.product(operation_cubes, cubes)):
                     print("-----------Broken cut algorithm")
@@ -197,7 +206,7 @@ def main() -> None:
                     pprint(overlapping)
                     break
 
-            print(f"adding {len(operation_cubes)}")
+            verbosity.trace(f"adding {len(operation_cubes)}")
             cubes.extend(operation_cubes)
 
         else:
@@ -207,6 +216,9 @@ def main() -> None:
                 )
             )
 
+        if not verbosity.enabled(verbosity.TRACE):
+            continue
+
         # Overlap?
         overlapping = [(a, b) for a, b in itertools.combinations(cubes, 2) if a.touches(b)]
         print(f"{operation : >3} | {len(cubes) : >6} | {len(overlapping)} | {sum(c.volume for c in cubes) : >18}")
@@ -218,9 +230,11 @@ def main() -> None:
         plot_cubes(cubes)
         # Consolidation?
 
+    print(sum(cube.volume for cube in cubes))
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
 
 
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import List, Tuple, Union, Iterable
 from functools import cache, reduce
 
+from aoc import verbosity
+
 from iter_utils import grouper
 
 
@@ -202,7 +204,7 @@ def chunked_evaluation(program: List, iteration_order: Iterable, position: int =
 
             if license:
                 license = str(i) + license
-                print(" " * position + license)
+                verbosity.trace(" " * position + license)
                 CHUNK_CACHE[cache_key] = license
 
                 return license
@@ -229,6 +231,6 @@ def python_from_instructions(strings: List[str]):
         for chunk in chunked_program
     ]
     for ps in python_strings:
-        print(ps)
+        verbosity.info(ps)
 
     return python_strings
\ No newline at end of file
@@ -3,6 +3,8 @@
 
 import sys
 
+from aoc import verbosity
+
 from instructions import chunked_evaluation, python_from_instructions
 
 
@@ -14,4 +16,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    verbosity.parse_arguments()
     main()
@@ -0,0 +1,8 @@
+"""Shared tooling for running and measuring the daily solutions.
+
+The daily solutions live in `NN/solve_[ab].py` and are still runnable as
+standalone scripts. This package adds a single entry point which runs them
+in-process:
+
+    python3 -m aoc run 01 15b --input input.txt
+"""
@@ -0,0 +1,283 @@
+"""Command line entry point, see `python3 -m aoc --help`."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from aoc import profiling
+from aoc import runner
+from aoc import scheduler
+from aoc import verbosity
+from aoc.bench import gate
+from aoc.bench import harness
+from aoc.bench import startup
+from aoc.bench.generators import generate
+from aoc.cache import AnswerCache
+
+
+def run_command(arguments: argparse.Namespace) -> int:
+    solvers = runner.select(runner.discover(), arguments.days)
+    cache = AnswerCache() if arguments.cache else None
+    level = verbosity.LEVELS[arguments.verbosity]
+    history = scheduler.History()
+
+    if arguments.profiler:
+        return profile_command(arguments, solvers)
+
+    start = time.perf_counter()
+    if arguments.jobs > 1:
+        results = scheduler.run_parallel(
+            solvers,
+            arguments.input,
+            jobs=arguments.jobs,
+            timeout=arguments.timeout,
+            memory_limit=arguments.memory and arguments.memory * 1024 * 1024,
+            level=level,
+            answer_cache=cache,
+            history=history,
+        )
+
+    else:
+        results = [
+            runner.run(
+                solver,
+                solver.input_path(arguments.input),
+                timeout=arguments.timeout,
+                level=level,
+                cache=cache,
+            )
+            for solver in solvers
+        ]
+
+    history.update(results)
+    scheduler.print_summary(results, time.perf_counter() - start)
+
+    return int(any(result.error for result in results))
+
+
+def profile_command(arguments: argparse.Namespace, solvers: List[runner.Solver]) -> int:
+    """Run solvers one at a time with a profiler and report after each."""
+    failed = False
+    for solver in solvers:
+        if arguments.profiler == "profile":
+            profiler = profiling.CProfiler(
+                arguments.profile_dir / f"{solver.name}.prof", top=arguments.top
+            )
+        elif arguments.profiler == "memprofile":
+            profiler = profiling.MemoryProfiler(top=arguments.top)
+        else:
+            profiler = profiling.Sampler(
+                arguments.profile_dir / f"{solver.name}.stacks", top=arguments.top
+            )
+
+        result = runner.run(
+            solver,
+            solver.input_path(arguments.input),
+            timeout=arguments.timeout,
+            level=verbosity.LEVELS[arguments.verbosity],
+            profiler=profiler,
+        )
+        runner.print_results([result])
+        if result.seconds:  # Otherwise the solver never ran, i.e. missing input
+            profiler.report()
+
+        print()
+        failed = failed or result.error is not None
+
+    return int(failed)
+
+
+def generate_command(arguments: argparse.Namespace) -> int:
+    sys.stdout.write(generate(arguments.day.zfill(2), scale=arguments.scale, seed=arguments.seed))
+
+    return 0
+
+
+def bench_command(arguments: argparse.Namespace) -> int:
+    solvers = runner.select(runner.discover(), arguments.days)
+    measurements = harness.curves(
+        solvers, scales=arguments.scales, seed=arguments.seed, budget=arguments.budget
+    )
+    harness.print_curves(measurements)
+
+    if arguments.output:
+        harness.save(measurements, arguments.output)
+
+    return 0
+
+
+def gate_command(arguments: argparse.Namespace) -> int:
+    baseline = harness.load(arguments.baseline)
+    scales = sorted({measurement.scale for measurement in baseline})
+    solvers = runner.select(runner.discover(), arguments.days)
+    if not arguments.update:
+        solvers = [solver for solver in solvers if any(m.solver == solver.name for m in baseline)]
+
+    measurements = []
+    for solver in solvers:
+        # Parts are measured at the scales they finished at, new parts at all scales
+        before = [measurement for measurement in baseline if measurement.solver == solver.name]
+        measurements += harness.curves(
+            [solver],
+            scales=[measurement.scale for measurement in before] or scales,
+            seed=arguments.seed,
+            budget=gate.time_limit(before, arguments.budget),
+        )
+
+    selected = {solver.name for solver in solvers}
+    if arguments.update:
+        kept = [measurement for measurement in baseline if measurement.solver not in selected]
+        finished = [measurement for measurement in measurements if measurement.error is None]
+        harness.save(
+            sorted(kept + finished, key=lambda m: (m.solver, m.scale)), arguments.baseline
+        )
+        print(f"{len(finished)} measurements saved to {arguments.baseline}")
+
+        for measurement in measurements:
+            if measurement.error is not None:
+                print(f"{measurement.solver} {measurement.scale} not saved: {measurement.error}")
+
+        unmeasured = sorted(selected - {measurement.solver for measurement in finished})
+        if unmeasured:
+            print(f"no baseline for {', '.join(unmeasured)}, not even at scale {scales[0]}")
+
+        return int(bool(unmeasured))
+
+    differences = gate.compare(
+        (measurement for measurement in baseline if measurement.solver in selected),
+        measurements,
+        tolerance=arguments.tolerance,
+        min_seconds=arguments.min_seconds,
+    )
+    if differences:
+        gate.print_differences(differences)
+
+    regressions = sum(1 for difference in differences if difference.failed)
+    print(f"{len(measurements)} measurements, {regressions} regressions")
+
+    return int(regressions > 0)
+
+
+def startup_command(arguments: argparse.Namespace) -> int:
+    solvers = runner.select(runner.discover(), arguments.days)
+    startup.print_startups(startup.measure_all(solvers), top=arguments.top)
+
+    return 0
+
+
+def scales(string: str) -> List[int]:
+    return [int(scale) for scale in string.split(",")]
+
+
+def add_verbosity_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--verbosity", choices=verbosity.LEVELS, default="quiet",
+        help="output level of the solutions, by default only the answer",
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="aoc", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run solutions in-process and time them")
+    run_parser.add_argument("days", nargs="*", help="days or parts to run, i.e. 01 15b")
+    run_parser.add_argument(
+        "--input", default="input.txt", help="input file name in each day directory"
+    )
+    run_parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="run the parts in this many worker processes, the longest first",
+    )
+    run_parser.add_argument(
+        "--timeout", type=float, help="abort a part after this many seconds"
+    )
+    run_parser.add_argument(
+        "--memory", type=int,
+        help="limit the address space of every worker to this many MiB, needs --jobs",
+    )
+    run_parser.add_argument(
+        "--no-cache", dest="cache", action="store_false",
+        help="always run the solutions, don't use or store cached answers",
+    )
+    profilers = run_parser.add_mutually_exclusive_group()
+    profilers.add_argument(
+        "--profile", dest="profiler", action="store_const", const="profile",
+        help="profile every part with cProfile, stats are saved to --profile-dir",
+    )
+    profilers.add_argument(
+        "--memprofile", dest="profiler", action="store_const", const="memprofile",
+        help="report the lines allocating the most memory with tracemalloc",
+    )
+    profilers.add_argument(
+        "--sample", dest="profiler", action="store_const", const="sample",
+        help="sample the stack every millisecond, stacks are saved to --profile-dir",
+    )
+    run_parser.add_argument(
+        "--profile-dir", type=Path, default=Path("profiles"),
+        help="directory for the --profile and --sample output",
+    )
+    run_parser.add_argument(
+        "--top", type=int, default=20, help="number of entries in the profile reports"
+    )
+    add_verbosity_argument(run_parser)
+    run_parser.set_defaults(handler=run_command)
+
+    generate_parser = commands.add_parser("generate", help="print a generated input")
+    generate_parser.add_argument("day", help="day to generate input for, i.e. 15")
+    generate_parser.add_argument("--scale", type=int, default=1)
+    generate_parser.add_argument("--seed", type=int, default=2021)
+    generate_parser.set_defaults(handler=generate_command)
+
+    bench_parser = commands.add_parser("bench", help="time solutions on generated inputs")
+    bench_parser.add_argument("days", nargs="*", help="days or parts to run, i.e. 01 15b")
+    bench_parser.add_argument("--scales", type=scales, default=harness.SCALES)
+    bench_parser.add_argument("--seed", type=int, default=2021)
+    bench_parser.add_argument(
+        "--budget", type=float, default=10.0,
+        help="abort a run after this many seconds and skip the bigger scales",
+    )
+    bench_parser.add_argument("--output", type=Path, help="save the measurements as JSON")
+    bench_parser.set_defaults(handler=bench_command)
+
+    gate_parser = commands.add_parser(
+        "gate", help="fail if the benchmarks are slower than the baseline"
+    )
+    gate_parser.add_argument("days", nargs="*", help="days or parts to check, i.e. 01 15b")
+    gate_parser.add_argument("--baseline", type=Path, default=gate.BASELINE_PATH)
+    gate_parser.add_argument(
+        "--tolerance", type=float, default=gate.BASELINE_TOLERANCE,
+        help="allowed slowdown, 0.25 is 25 %% slower than the baseline",
+    )
+    gate_parser.add_argument(
+        "--min-seconds", type=float, default=gate.MIN_SECONDS,
+        help="differences smaller than this are noise",
+    )
+    gate_parser.add_argument("--seed", type=int, default=2021)
+    gate_parser.add_argument(
+        "--budget", type=float, default=10.0,
+        help="abort a run after this many seconds, or twice the baseline time of its part",
+    )
+    gate_parser.add_argument(
+        "--update", action="store_true", help="save the measurements as the new baseline"
+    )
+    gate_parser.set_defaults(handler=gate_command)
+
+    startup_parser = commands.add_parser(
+        "startup", help="report the import time of every solution"
+    )
+    startup_parser.add_argument("days", nargs="*", help="days or parts to load, i.e. 01 15b")
+    startup_parser.add_argument("--top", type=int, default=3, help="slowest imports to show")
+    startup_parser.set_defaults(handler=startup_command)
+
+    arguments = parser.parse_args()
+    if arguments.command == "run" and arguments.memory is not None and arguments.jobs < 2:
+        run_parser.error("--memory limits the worker processes, it needs --jobs 2 or more")
+
+    return arguments.handler(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
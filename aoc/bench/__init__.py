@@ -0,0 +1,5 @@
+"""Benchmarks on generated inputs.
+
+    python3 -m aoc generate 15 --scale 10 > 15/large.txt
+    python3 -m aoc bench 15 22 --scales 1,10,100 --output bench.json
+"""
@@ -0,0 +1,169 @@
+"""Compare benchmark measurements against a stored baseline.
+
+Every (part, scale) in the baseline is measured again, with a time limit of
+the budget or twice the baseline time of the part, whichever is longer, so
+parts that need minutes aren't aborted by the budget. The gate fails if a
+measurement is slower than the baseline by more than the tolerance, if the
+answer changed, or if it now fails or doesn't reach a scale it used to. A
+baseline entry which failed itself fails the gate too, as it would leave its
+part unchecked. Tiny differences below min_seconds are noise and never fail
+the gate.
+"""
+
+import sys
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from aoc.bench.harness import Measurement
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+BASELINE_TOLERANCE = 0.25
+"""Allowed slowdown relative to the baseline, 0.25 is 25 % slower."""
+
+MIN_SECONDS = 0.01
+
+TIME_LIMIT_FACTOR = 2.0
+"""A part may run this many times its slowest baseline time before it is aborted."""
+
+
+@dataclass
+class Difference:
+    solver: str
+    scale: int
+    baseline: Optional[Measurement]
+    current: Optional[Measurement]
+    reason: str
+    failed: bool = True
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the runtime, 0.5 is 50 % slower."""
+        if self.baseline is None or self.current is None or self.baseline.seconds <= 0:
+            return None
+
+        return self.current.seconds / self.baseline.seconds - 1
+
+
+def by_key(measurements: Iterable[Measurement]) -> Dict[Tuple[str, int], Measurement]:
+    return {(measurement.solver, measurement.scale): measurement for measurement in measurements}
+
+
+def time_limit(baseline: Iterable[Measurement], budget: float) -> float:
+    """Return the seconds a part may run, baseline are its measurements at all scales."""
+    return max([budget, *(TIME_LIMIT_FACTOR * measurement.seconds for measurement in baseline)])
+
+
+def compare(
+    baseline: Iterable[Measurement],
+    current: Iterable[Measurement],
+    tolerance: float = BASELINE_TOLERANCE,
+    min_seconds: float = MIN_SECONDS,
+) -> List[Difference]:
+    """Return the differences of current from baseline, ordered by part and scale.
+
+    Speedups beyond the tolerance are returned too, but don't fail.
+    """
+    baseline_by_key = by_key(baseline)
+    current_by_key = by_key(current)
+
+    differences = []
+    for key, before in sorted(baseline_by_key.items()):
+        after = current_by_key.get(key)
+        if before.error is not None:
+            differences.append(Difference(*key, before, after, f"baseline {before.error}"))
+
+        elif after is None:
+            differences.append(Difference(*key, before, after, "not measured"))
+
+        elif after.error is not None:
+            differences.append(Difference(*key, before, after, after.error))
+
+        elif after.answer != before.answer:
+            differences.append(
+                Difference(*key, before, after, f"answer {before.answer} -> {after.answer}")
+            )
+
+        elif abs(after.seconds - before.seconds) >= min_seconds:
+            if after.seconds > before.seconds * (1 + tolerance):
+                differences.append(Difference(*key, before, after, "slower"))
+
+            elif after.seconds < before.seconds * (1 - tolerance):
+                differences.append(Difference(*key, before, after, "faster", failed=False))
+
+    return differences
+
+
+def print_differences(differences: List[Difference], file=sys.stdout) -> None:
+    print(
+        f"  {'day' : <4} | {'scale' : >5} | {'baseline s' : >10} | {'current s' : >10} | "
+        f"{'change' : >8} | reason",
+        file=file,
+    )
+    for difference in differences:
+        before = f"{difference.baseline.seconds : >10.4f}" if difference.baseline else " " * 10
+        after = f"{difference.current.seconds : >10.4f}" if difference.current else " " * 10
+        change = f"{difference.change : >+8.0%}" if difference.change is not None else " " * 8
+        print(
+            f"{'-' if difference.failed else '+'} {difference.solver : <4} | "
+            f"{difference.scale : >5} | {before} | {after} | {change} | {difference.reason}",
+            file=file,
+        )
+
+
+class TestCompare(unittest.TestCase):
+    def test_slow_parts_should_have_twice_their_baseline_time(self):
+        # Given
+        baseline = [
+            Measurement("24b", 1, 100, 60.0, 0, "9"),
+            Measurement("24b", 10, 1000, 1.0, 0, "9"),
+        ]
+
+        # When
+        result = (time_limit(baseline, budget=10.0), time_limit(baseline[1:], budget=10.0))
+
+        # Then
+        self.assertEqual((120.0, 10.0), result)
+
+    def test_only_slowdowns_beyond_tolerance_should_fail(self):
+        # Given
+        baseline = [
+            Measurement("01a", 1, 100, 1.0, 0, "7"),
+            Measurement("01a", 10, 1000, 10.0, 0, "70"),
+            Measurement("01b", 1, 100, 1.0, 0, "5"),
+        ]
+        current = [
+            Measurement("01a", 1, 100, 1.2, 0, "7"),
+            Measurement("01a", 10, 1000, 13.0, 0, "70"),
+            Measurement("01b", 1, 100, 0.5, 0, "5"),
+        ]
+
+        # When
+        result = compare(baseline, current, tolerance=0.25)
+
+        # Then
+        expected = [("01a", 10, "slower", True), ("01b", 1, "faster", False)]
+        self.assertEqual(
+            expected,
+            [(d.solver, d.scale, d.reason, d.failed) for d in result],
+        )
+
+    def test_failed_baseline_entries_should_fail(self):
+        # Given
+        baseline = [Measurement("15a", 1, 100, 5.0, 0, "", error="Timeout: after 5.0 s")]
+        current = [Measurement("15a", 1, 100, 4.0, 0, "40")]
+
+        # When
+        result = compare(baseline, current)
+
+        # Then
+        self.assertEqual(
+            [("15a", 1, "baseline Timeout: after 5.0 s", True)],
+            [(d.solver, d.scale, d.reason, d.failed) for d in result],
+        )
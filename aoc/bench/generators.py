@@ -0,0 +1,490 @@
+"""Deterministic generators of puzzle inputs.
+
+Every generator takes a scale and a seeded `random.Random` and returns the
+input as a string. Scale 1 resembles the size of the real puzzle input, the
+input grows linearly with the scale (for grids this is the area).
+"""
+
+import itertools
+import math
+import random
+import string
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: Dict[str, Generator] = {}
+"""Generators by day."""
+
+
+def generator(day: str) -> Callable[[Generator], Generator]:
+    def register(function: Generator) -> Generator:
+        GENERATORS[day] = function
+
+        return function
+
+    return register
+
+
+def generate(day: str, scale: int = 1, seed: int = 2021) -> str:
+    """Return the generated input for day, the same seed always gives the same input."""
+    return GENERATORS[day](scale, random.Random(f"{day}:{scale}:{seed}"))
+
+
+def grid_side(side: int, scale: int) -> int:
+    """Return the side of a square grid with scale times the area."""
+    return round(side * math.sqrt(scale))
+
+
+def digit_grid(width: int, height: int, rng: random.Random, digits: str) -> str:
+    return "\n".join(
+        "".join(rng.choice(digits) for _ in range(width)) for _ in range(height)
+    ) + "\n"
+
+
+@generator("01")
+def sonar_sweep(scale: int, rng: random.Random) -> str:
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(2000 * scale):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(depth)
+
+    return "\n".join(map(str, depths)) + "\n"
+
+
+@generator("02")
+def planned_course(scale: int, rng: random.Random) -> str:
+    commands = rng.choices(("forward", "down", "up"), weights=(4, 4, 2), k=1000 * scale)
+
+    return "".join(f"{command} {rng.randint(1, 9)}\n" for command in commands)
+
+
+@generator("03")
+def diagnostic_report(scale: int, rng: random.Random) -> str:
+    # Random but unique, the ratings are ambiguous with duplicates. Every
+    # fourth number is used, as in the real input with 1000 12-bit numbers.
+    width = (4000 * scale - 1).bit_length()
+    numbers = rng.sample(range(2 ** width), k=1000 * scale)
+
+    return "".join(f"{number:0{width}b}\n" for number in numbers)
+
+
+@generator("04")
+def bingo_subsystem(scale: int, rng: random.Random) -> str:
+    draws = rng.sample(range(100), k=100)
+    boards = (
+        "\n".join(
+            " ".join(f"{number : >2}" for number in row)
+            for row in zip(*[iter(rng.sample(range(100), k=25))] * 5)
+        )
+        for _ in range(100 * scale)
+    )
+
+    return ",".join(map(str, draws)) + "\n\n" + "\n\n".join(boards) + "\n"
+
+
+@generator("05")
+def hydrothermal_vents(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(500 * scale):
+        x1, y1 = rng.randint(10, 980), rng.randint(10, 980)
+        length = rng.randint(1, min(x1, y1, 990 - x1, 990 - y1, 500))
+        dx, dy = rng.choice([(1, 0), (0, 1), (-1, 0), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)])
+        lines.append(f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}\n")
+
+    return "".join(lines)
+
+
+@generator("06")
+def lanternfish(scale: int, rng: random.Random) -> str:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(300 * scale)) + "\n"
+
+
+@generator("07")
+def crab_positions(scale: int, rng: random.Random) -> str:
+    return ",".join(str(int(rng.expovariate(1 / 400))) for _ in range(1000 * scale)) + "\n"
+
+
+SEGMENTS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+@generator("08")
+def seven_segment_notes(scale: int, rng: random.Random) -> str:
+    def scrambled(pattern: str, wiring: Dict[str, str]) -> str:
+        return "".join(rng.sample([wiring[segment] for segment in pattern], k=len(pattern)))
+
+    lines = []
+    for _ in range(200 * scale):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", k=7)))
+        patterns = [scrambled(pattern, wiring) for pattern in rng.sample(SEGMENTS, k=10)]
+        outputs = [scrambled(rng.choice(SEGMENTS), wiring) for _ in range(4)]
+        lines.append(f"{' '.join(patterns)} | {' '.join(outputs)}\n")
+
+    return "".join(lines)
+
+
+@generator("09")
+def heightmap(scale: int, rng: random.Random) -> str:
+    side = grid_side(100, scale)
+    # Basins are separated by ridges of nines
+    return "\n".join(
+        "".join(
+            "9" if (x % 10 == 0 or y % 10 == 0) and rng.random() < 0.8 else rng.choice("012345678")
+            for x in range(side)
+        )
+        for y in range(side)
+    ) + "\n"
+
+
+@generator("10")
+def navigation_subsystem(scale: int, rng: random.Random) -> str:
+    pairs = {"(": ")", "[": "]", "{": "}", "<": ">"}
+    lines = []
+    for _ in range(100 * scale):
+        line: List[str] = []
+        stack: List[str] = []
+        corrupted = rng.random() < 0.5
+        for _ in range(rng.randint(80, 110)):
+            if stack and rng.random() < 0.45:
+                line.append(pairs[stack.pop()])
+
+            else:
+                stack.append(rng.choice("([{<"))
+                line.append(stack[-1])
+
+        if corrupted and stack:
+            line.append(rng.choice([c for c in pairs.values() if c != pairs[stack[-1]]]))
+
+        elif not stack:
+            line.append(rng.choice("([{<"))
+
+        lines.append("".join(line) + "\n")
+
+    return "".join(lines)
+
+
+@generator("11")
+def octopus_energy(scale: int, rng: random.Random) -> str:
+    """Return a grid which flashes all at once within some tens of steps.
+
+    Uniformly random energies mostly cycle without ever flashing all at once,
+    so most octopuses start out at the same energy and a tenth at random.
+    """
+    side = grid_side(10, scale)
+    common = rng.choice(string.digits)
+
+    return "\n".join(
+        "".join(rng.choice(string.digits) if rng.random() < 0.1 else common for _ in range(side))
+        for _ in range(side)
+    ) + "\n"
+
+
+@generator("12")
+def cave_system(scale: int, rng: random.Random) -> str:
+    small = [f"{a}{b}" for a, b in itertools.product(string.ascii_lowercase, repeat=2)]
+    small = rng.sample([name for name in small if name not in ("st", "en")], k=5 + scale)
+    big = [name.upper() for name in rng.sample(small, k=max(1, len(small) // 3))]
+
+    edges = set()
+    for name in small:
+        edges.add(tuple(sorted((name, rng.choice(big)))))
+        edges.add(tuple(sorted((name, rng.choice(small + ["start", "end"])))))
+
+    edges.add((rng.choice(big), "end"))
+    edges.add(("start", rng.choice(big)))
+
+    return "".join(f"{a}-{b}\n" for a, b in sorted(edges) if a != b)
+
+
+@generator("13")
+def transparent_paper(scale: int, rng: random.Random) -> str:
+    folds = [("x", 655), ("y", 447), ("x", 327), ("y", 223), ("x", 163),
+             ("y", 111), ("x", 81), ("y", 55), ("x", 40), ("y", 27), ("y", 13), ("y", 6)]
+
+    def on_a_fold(x: int, y: int) -> bool:
+        for axis, fold in folds:
+            value = x if axis == "x" else y
+            if value == fold:
+                return True
+
+            if value > fold:
+                x, y = (2 * fold - x, y) if axis == "x" else (x, 2 * fold - y)
+
+        return False
+
+    dots = set()
+    while len(dots) < 800 * scale:
+        x, y = rng.randrange(1311), rng.randrange(895)
+        if not on_a_fold(x, y):
+            dots.add((x, y))
+
+    instructions = "".join(f"fold along {axis}={fold}\n" for axis, fold in folds)
+
+    return "".join(f"{x},{y}\n" for x, y in dots) + "\n" + instructions
+
+
+@generator("14")
+def polymer_template(scale: int, rng: random.Random) -> str:
+    elements = rng.sample(string.ascii_uppercase, k=10)
+    template = "".join(rng.choices(elements, k=20 * scale))
+    rules = "".join(
+        f"{first}{second} -> {rng.choice(elements)}\n"
+        for first, second in itertools.product(elements, repeat=2)
+    )
+
+    return template + "\n\n" + rules
+
+
+@generator("15")
+def chiton_risk(scale: int, rng: random.Random) -> str:
+    side = grid_side(100, scale)
+
+    return digit_grid(side, side, rng, "123456789")
+
+
+VALUES = (0, 1, 2, 3)
+"""Type IDs of the operators on the values of their subpackets: sum, product, min and max."""
+
+COMPARISONS = (5, 6, 7)
+"""Type IDs of the operators which are 1 or 0: >, < and =."""
+
+
+def packet_bits(
+    rng: random.Random, budget: int, depth: int = 0, comparison: bool = False
+) -> str:
+    """Return the bits for a random packet with roughly budget subpackets.
+
+    Only a packet where comparison is true can be a comparison, every other
+    packet is positive. The first subpacket of an operator is never a
+    comparison and neither is any subpacket of a product or minimum, or else
+    a 0 would take most transmissions to 0.
+    """
+    version = f"{rng.randrange(8):03b}"
+    if budget <= 1 or depth > 20:
+        value = rng.randrange(1, 2 ** rng.randint(4, 32))
+        nibbles = f"{value:b}".zfill(((value.bit_length() + 3) // 4 or 1) * 4)
+        groups = [nibbles[i:i + 4] for i in range(0, len(nibbles), 4)]
+
+        return version + "100" + "".join(
+            ("1" if i < len(groups) - 1 else "0") + group for i, group in enumerate(groups)
+        )
+
+    type_id = rng.choice(VALUES + COMPARISONS if comparison else VALUES)
+    count = 2 if type_id in COMPARISONS else rng.randint(1, min(budget, 8))
+    subpackets = [
+        packet_bits(rng, (budget - 1) // count, depth + 1, index > 0 and type_id not in (1, 2))
+        for index in range(count)
+    ]
+
+    payload = "".join(subpackets)
+    if rng.random() < 0.5 and len(payload) < 2 ** 15:
+        return version + f"{type_id:03b}" + "0" + f"{len(payload):015b}" + payload
+
+    return version + f"{type_id:03b}" + "1" + f"{count:011b}" + payload
+
+
+@generator("16")
+def bits_transmission(scale: int, rng: random.Random) -> str:
+    bits = packet_bits(rng, budget=80 * scale)
+    bits += "0" * (-len(bits) % 4)
+
+    return "".join(f"{int(bits[i:i + 4], base=2):X}" for i in range(0, len(bits), 4)) + "\n"
+
+
+@generator("17")
+def target_area(scale: int, rng: random.Random) -> str:
+    """Return a target area below the submarine, scale times the area of the real one."""
+    factor = math.sqrt(scale)
+    x_min = round(rng.randint(100, 200) * factor)
+    y_min = -round(rng.randint(100, 150) * factor)
+    x_max = x_min + round(rng.randint(20, 40) * factor)
+    y_max = y_min + round(rng.randint(20, 40) * factor)
+
+    return f"target area: x={x_min}..{x_max}, y={y_min}..{y_max}\n"
+
+
+@generator("18")
+def snailfish_homework(scale: int, rng: random.Random) -> str:
+    def number(depth: int) -> str:
+        if depth == 4 or (depth > 1 and rng.random() < 0.3):
+            return str(rng.randint(0, 9))
+
+        return f"[{number(depth + 1)},{number(depth + 1)}]"
+
+    return "".join(number(0) + "\n" for _ in range(100 * scale))
+
+
+ROTATIONS: List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = [
+    (axes, signs)
+    for axes in itertools.permutations(range(3))
+    for signs in itertools.product((1, -1), repeat=3)
+    # Keep only proper rotations, no mirroring
+    if math.prod(signs) * (1 if axes in [(0, 1, 2), (1, 2, 0), (2, 0, 1)] else -1) == 1
+]
+
+
+@generator("19")
+def scanner_reports(scale: int, rng: random.Random) -> str:
+    scanners = [(0, 0, 0)]
+    beacons = set()
+
+    def visible(scanner, beacon) -> bool:
+        return all(abs(b - s) <= 1000 for s, b in zip(scanner, beacon))
+
+    def fill(low, high, count: int) -> None:
+        region = [b for b in beacons if all(l <= v <= h for l, v, h in zip(low, b, high))]
+        for _ in range(count - len(region)):
+            beacons.add(tuple(rng.randint(l, h) for l, h in zip(low, high)))
+
+    fill((-1000,) * 3, (1000,) * 3, 26)
+    while len(scanners) < 30 * scale:
+        parent = rng.choice(scanners)
+        axis = rng.randrange(3)
+        scanner = tuple(
+            p + (
+                rng.choice((-1, 1)) * rng.randint(1000, 1200)
+                if a == axis
+                else rng.randint(-100, 100)
+            )
+            for a, p in enumerate(parent)
+        )
+        if scanner in scanners:
+            continue
+
+        overlap_low = tuple(max(p, s) - 1000 for p, s in zip(parent, scanner))
+        overlap_high = tuple(min(p, s) + 1000 for p, s in zip(parent, scanner))
+        fill(overlap_low, overlap_high, 12)
+        fill(tuple(s - 1000 for s in scanner), tuple(s + 1000 for s in scanner), 26)
+        scanners.append(scanner)
+
+    reports = []
+    for index, scanner in enumerate(scanners):
+        axes, signs = ROTATIONS[0] if index == 0 else rng.choice(ROTATIONS)
+        seen = [
+            tuple(b - s for b, s in zip(beacon, scanner))
+            for beacon in beacons
+            if visible(scanner, beacon)
+        ]
+        rng.shuffle(seen)
+        lines = [
+            ",".join(str(sign * relative[a]) for a, sign in zip(axes, signs))
+            for relative in seen
+        ]
+        reports.append(f"--- scanner {index} ---\n" + "\n".join(lines))
+
+    return "\n\n".join(reports) + "\n"
+
+
+@generator("20")
+def trench_map(scale: int, rng: random.Random) -> str:
+    algorithm = "#" + "".join(rng.choice("#.") for _ in range(510)) + "."
+    side = grid_side(100, scale)
+
+    return algorithm + "\n\n" + digit_grid(side, side, rng, "#.")
+
+
+@generator("21")
+def starting_positions(_scale: int, rng: random.Random) -> str:
+    """Return the starting positions of both players, the game doesn't grow with the scale."""
+    return "".join(
+        f"Player {player} starting position: {rng.randint(1, 10)}\n" for player in (1, 2)
+    )
+
+
+@generator("22")
+def reboot_steps(scale: int, rng: random.Random) -> str:
+    """Return 20 steps in the initialization region and 400 larger ones per scale.
+
+    Every 100th larger step has a corner in the initialization region, the
+    others lie outside of it. A step covering all of the region would decide
+    part one on its own.
+    """
+    region = 50
+
+    def step(ranges: List[Tuple[int, int]]) -> str:
+        operation = "on" if rng.random() < 0.7 else "off"
+        x, y, z = (f"{start}..{stop}" for start, stop in ranges)
+
+        return f"{operation} x={x},y={y},z={z}\n"
+
+    def random_range(limit: int, size: int) -> Tuple[int, int]:
+        start = rng.randint(-limit, limit - size)
+
+        return start, start + rng.randint(size // 4, size)
+
+    def outside(limit: int, size: int) -> List[Tuple[int, int]]:
+        while True:
+            ranges = [random_range(limit, size) for _ in range(3)]
+            if not all(start <= region and stop >= -region for start, stop in ranges):
+                return ranges
+
+    def corner(size: int) -> List[Tuple[int, int]]:
+        ranges = []
+        for _ in range(3):
+            inner, length = rng.randint(-region, region), rng.randint(size // 4, size)
+            if rng.random() < 0.5:
+                ranges.append((inner - length, inner))
+
+            else:
+                ranges.append((inner, inner + length))
+
+        return ranges
+
+    initialization = [step([random_range(region, region) for _ in range(3)]) for _ in range(20)]
+    reboot = [
+        step(corner(40_000) if index % 100 == 99 else outside(100_000, 40_000))
+        for index in range(400 * scale)
+    ]
+
+    return "".join(initialization + reboot)
+
+
+MONAD_CHUNK = """inp w
+mul x 0
+add x z
+mod x 26
+div z {divisor}
+add x {check}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {offset}
+mul y x
+add z y
+"""
+
+
+@generator("24")
+def monad_program(scale: int, rng: random.Random) -> str:
+    """Return a MONAD program with 14 digits for every scale."""
+    chunks = []
+    for _ in range(scale):
+        stack: List[int] = []
+        pushes = 7
+        for _ in range(14):
+            if pushes and (not stack or rng.random() < 0.5):
+                pushes -= 1
+                offset = rng.randint(1, 15)
+                stack.append(offset)
+                chunks.append(
+                    MONAD_CHUNK.format(divisor=1, check=rng.randint(10, 15), offset=offset)
+                )
+
+            else:
+                difference = rng.randint(-8, 8)
+                check = difference - stack.pop()
+                chunks.append(
+                    MONAD_CHUNK.format(divisor=26, check=check, offset=rng.randint(1, 15))
+                )
+
+    return "".join(chunks)
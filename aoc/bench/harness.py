@@ -0,0 +1,157 @@
+"""Run the solutions on generated inputs of growing size.
+
+Measuring the same solution at several scales gives a timing curve, the
+growth exponent between two points tells the asymptotic behaviour: ~1 is
+linear, ~2 quadratic and so on.
+"""
+
+import json
+import math
+import sys
+import tempfile
+import unittest
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from aoc import runner
+from aoc.bench.generators import GENERATORS
+from aoc.bench.generators import generate
+
+SCALES = (1, 10, 100)
+
+
+@dataclass
+class Measurement:
+    solver: str
+    scale: int
+    input_bytes: int
+    seconds: float
+    peak_rss: int
+    answer: str
+    error: Optional[str] = None
+
+
+def input_file(directory: Path, day: str, scale: int, seed: int) -> Path:
+    """Return the path to the generated input, generating it only once."""
+    path = directory / f"{day}-{scale}-{seed}.txt"
+    if not path.exists():
+        path.write_text(generate(day, scale=scale, seed=seed))
+
+    return path
+
+
+def curves(
+    solvers: Iterable[runner.Solver],
+    scales: Iterable[int] = SCALES,
+    seed: int = 2021,
+    budget: float = 10.0,
+) -> List[Measurement]:
+    """Return measurements for all solvers with a generator, for every scale.
+
+    A run is aborted after budget seconds, and the solver is then not
+    measured at bigger scales.
+    """
+    measurements = []
+    with tempfile.TemporaryDirectory(prefix="aoc-bench-") as directory:
+        for solver in solvers:
+            if solver.day not in GENERATORS:
+                continue
+
+            for scale in sorted(scales):
+                path = input_file(Path(directory), solver.day, scale, seed)
+                result = runner.run(solver, input_path=path, timeout=budget)
+                measurements.append(
+                    Measurement(
+                        solver=solver.name,
+                        scale=scale,
+                        input_bytes=path.stat().st_size,
+                        seconds=result.seconds,
+                        peak_rss=result.peak_rss,
+                        answer=result.answer,
+                        error=result.error,
+                    )
+                )
+                if result.error:
+                    break
+
+    return measurements
+
+
+def growth(first: Measurement, second: Measurement) -> float:
+    """Return the exponent k in seconds ~ scale ** k between two measurements."""
+    if first.seconds <= 0 or second.seconds <= 0:
+        return math.nan
+
+    return math.log(second.seconds / first.seconds) / math.log(second.scale / first.scale)
+
+
+def save(measurements: Iterable[Measurement], path: Path) -> None:
+    with open(path, "w") as output:
+        json.dump([asdict(measurement) for measurement in measurements], output, indent=2)
+        output.write("\n")
+
+
+def load(path: Path) -> List[Measurement]:
+    with open(path) as data:
+        return [Measurement(**measurement) for measurement in json.load(data)]
+
+
+def print_curves(measurements: List[Measurement], file=sys.stdout) -> None:
+    print(
+        f"{'day' : <4} | {'scale' : >5} | {'bytes' : >10} | {'seconds' : >9} | "
+        f"{'peak MiB' : >8} | {'growth' : >6} | answer",
+        file=file,
+    )
+    print("-" * 5 + "+" + "-" * 7 + "+" + "-" * 12 + "+" + "-" * 11 + "+" + "-" * 10
+          + "+" + "-" * 8 + "+" + "-" * 30, file=file)
+
+    previous = None
+    for measurement in measurements:
+        if previous is not None and previous.solver == measurement.solver:
+            exponent = f"{growth(previous, measurement) : >6.2f}"
+
+        else:
+            exponent = " " * 6
+
+        answer = measurement.answer if measurement.error is None else f"!! {measurement.error}"
+        print(
+            f"{measurement.solver : <4} | {measurement.scale : >5} | "
+            f"{measurement.input_bytes : >10} | "
+            f"{measurement.seconds : >9.4f} | {measurement.peak_rss / 1024 : >8.1f} | "
+            f"{exponent} | {answer[:30]}",
+            file=file,
+        )
+        previous = measurement
+
+
+class TestMeasurements(unittest.TestCase):
+    def test_quadratic_timing_should_grow_with_exponent_2(self):
+        # Given
+        first = Measurement("05a", 1, 100, 0.5, 0, "1")
+        second = Measurement("05a", 10, 1000, 50.0, 0, "2")
+
+        # When
+        result = growth(first, second)
+
+        # Then
+        self.assertAlmostEqual(2.0, result)
+
+    def test_saved_measurements_should_load_unchanged(self):
+        # Given
+        measurements = [
+            Measurement("05a", 1, 100, 0.5, 2048, "5"),
+            Measurement("05b", 10, 1000, 10.0, 4096, "", error="Timeout: after 10.0 s"),
+        ]
+
+        # When
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            save(measurements, path)
+            result = load(path)
+
+        # Then
+        self.assertEqual(measurements, result)
@@ -0,0 +1,147 @@
+"""Measure what loading a solution costs before it does any work.
+
+Every solution is loaded in a fresh interpreter with `python -X importtime`
+(without calling `main()`), the report is the total import time and the
+heaviest imports, the ones worth loading lazily.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from dataclasses import dataclass
+from dataclasses import field
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+from aoc import runner
+
+LOAD_SOLVER = """
+import importlib.util, sys
+sys.path.insert(0, {directory!r})
+spec = importlib.util.spec_from_file_location("solver", {path!r})
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+"""
+
+
+@dataclass
+class Startup:
+    solver: str
+    microseconds: int = 0
+    """Cumulative import time of all top level imports."""
+    imports: List[Tuple[int, str]] = field(default_factory=list)
+    """(cumulative microseconds, package) for the top level imports, slowest first."""
+    error: str = ""
+
+
+def parse_importtime(report: str) -> List[Tuple[int, str]]:
+    """Return (cumulative microseconds, package) for the top level imports in report.
+
+    The report lines look like `import time: self [us] | cumulative | package`,
+    nested imports have their package indented.
+    """
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _self, cumulative, package = line[len("import time:") :].split("|")
+        if not package.startswith("  "):
+            imports.append((int(cumulative), package.strip()))
+
+    return sorted(imports, reverse=True)
+
+
+def importtime(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter, the import time report is in stderr."""
+    environment = dict(os.environ, PYTHONPATH=str(runner.ROOT))
+
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=environment,
+        check=False,
+    )
+
+
+def interpreter_imports() -> FrozenSet[str]:
+    """Return the packages imported by the interpreter and LOAD_SOLVER itself."""
+    report = importtime("import importlib.util, sys").stderr
+
+    return frozenset(package for _microseconds, package in parse_importtime(report))
+
+
+def measure(solver: runner.Solver, ignored: FrozenSet[str] = frozenset()) -> Startup:
+    """Return the import times of loading solver in a fresh interpreter.
+
+    Imports in ignored, i.e. the interpreter_imports(), are left out.
+    """
+    code = LOAD_SOLVER.format(directory=str(solver.path.parent), path=str(solver.path))
+    process = importtime(code)
+
+    imports = [
+        (microseconds, package)
+        for microseconds, package in parse_importtime(process.stderr)
+        if package not in ignored
+    ]
+    startup = Startup(solver=solver.name, imports=imports)
+    startup.microseconds = sum(microseconds for microseconds, _package in startup.imports)
+    if process.returncode:
+        startup.error = process.stderr.strip().splitlines()[-1]
+
+    return startup
+
+
+def measure_all(solvers: Iterable[runner.Solver]) -> List[Startup]:
+    """Return the startups of the solvers that only do their work in main().
+
+    Loading the others runs the whole solution.
+    """
+    ignored = interpreter_imports()
+
+    return [
+        measure(solver, ignored)
+        for solver in solvers
+        if "def main(" in solver.path.read_text()
+    ]
+
+
+def print_startups(startups: Iterable[Startup], top: int = 3, file=sys.stdout) -> None:
+    print(f"{'day' : <4} | {'import ms' : >9} | slowest imports (ms)", file=file)
+    print("-" * 5 + "+" + "-" * 11 + "+" + "-" * 50, file=file)
+    for startup in startups:
+        slowest = ", ".join(
+            f"{package} {microseconds / 1000 :.1f}"
+            for microseconds, package in startup.imports[:top]
+        )
+        if startup.error:
+            slowest = f"!! {startup.error}"
+
+        print(
+            f"{startup.solver : <4} | {startup.microseconds / 1000 : >9.1f} | {slowest}",
+            file=file,
+        )
+
+
+class TestParseImporttime(unittest.TestCase):
+    def test_top_level_imports_should_be_slowest_first(self):
+        # Given
+        report = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:        90 |         90 |   _weakref",
+                "import time:       310 |        400 | weakref",
+                "import time:      2500 |      52000 | numpy",
+                "some warning",
+                "import time:        20 |         20 | aoc",
+            ]
+        )
+
+        # When
+        result = parse_importtime(report)
+
+        # Then
+        self.assertEqual([(52000, "numpy"), (400, "weakref"), (20, "aoc")], result)
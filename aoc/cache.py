@@ -0,0 +1,136 @@
+"""On-disk cache of answers, consulted by the runner before running a solver.
+
+An answer is stored under the day, the part, the sha256 of the input and the
+sha256 of the solver source (including the helper modules of the day and the
+shared modules of the aoc package), so changing either of them runs the
+solver again. Every answer is a small JSON file, the least recently used ones
+are removed when the cache grows past its size limit.
+
+The cache lives in $AOC_CACHE, by default ~/.cache/aoc.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Iterable
+from typing import Optional
+
+DIRECTORY = Path(
+    os.environ.get("AOC_CACHE")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "aoc"
+)
+
+MAX_BYTES = 1024 * 1024
+"""Size limit of all stored answers together."""
+
+
+def file_digest(paths: Iterable[Path]) -> str:
+    """Return the sha256 of the contents of all paths, in order."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as data:
+            for chunk in iter(lambda: data.read(1 << 20), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    def __init__(self, directory: Path = DIRECTORY, max_bytes: int = MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(
+        self, day: str, part: str, input_path: Optional[Path], sources: Iterable[Path]
+    ) -> str:
+        """Return the key for an answer, input_path is None for solvers without input."""
+        input_digest = file_digest([input_path] if input_path is not None else [])
+        source_digest = file_digest(sources)
+
+        return f"{day}{part}-{input_digest[:16]}-{source_digest[:16]}"
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored answer for key, None if there is none."""
+        path = self.path(key)
+        try:
+            with open(path) as entry:
+                answer = json.load(entry)["answer"]
+
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # The modification time orders the entries for eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+        return answer
+
+    def put(self, key: str, answer: str) -> None:
+        """Store answer for key and evict the least recently used answers."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Written to a temporary file first so a reader never sees half an entry
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as entry:
+            json.dump({"key": key, "answer": answer}, entry)
+
+        os.replace(entry.name, self.path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used answers until the cache fits in max_bytes."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry_size for _mtime, entry_size, _path in entries)
+        for _mtime, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+            size -= entry_size
+
+
+class TestAnswerCache(unittest.TestCase):
+    def test_stored_answer_should_be_returned(self):
+        # Given
+        with tempfile.TemporaryDirectory() as directory:
+            cache = AnswerCache(Path(directory))
+            cache.put("01a-key", "1234")
+
+            # When
+            result = cache.get("01a-key"), cache.get("01b-key")
+
+        # Then
+        self.assertEqual(("1234", None), result)
+
+    def test_least_recently_used_answer_should_be_evicted(self):
+        # Given
+        with tempfile.TemporaryDirectory() as directory:
+            cache = AnswerCache(Path(directory), max_bytes=80)
+            cache.put("old", "1")
+            cache.put("used", "2")
+            os.utime(cache.path("old"), (0, 0))
+            os.utime(cache.path("used"), (0, 0))
+            cache.get("used")
+
+            # When
+            cache.put("new", "3")
+
+            # Then
+            result = cache.get("old"), cache.get("used"), cache.get("new")
+
+        self.assertEqual((None, "2", "3"), result)
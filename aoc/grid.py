@@ -0,0 +1,253 @@
+"""Rectangular grids stored in a flat array.
+
+A cell is addressed by its index, `y * width + x`. Neighbours are looked up in
+tables which are computed once per grid size (the most recent ones are kept),
+so walking a grid never allocates positions:
+
+    grid = Grid.from_string(data)
+    neighbours = grid.orthogonal
+    for neighbour in neighbours[index]:
+        grid[neighbour] += 1
+"""
+
+import array
+import unittest
+from functools import lru_cache
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+Offsets = Tuple[Tuple[int, int], ...]
+
+ORTHOGONAL: Offsets = ((0, -1), (-1, 0), (1, 0), (0, 1))
+"""North, west, east and south."""
+
+SURROUNDING: Offsets = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+"""All eight surrounding cells, in reading order."""
+
+WINDOW: Offsets = tuple((x, y) for y in (-1, 0, 1) for x in (-1, 0, 1))
+"""The 3x3 window centered on the cell itself, in reading order."""
+
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+"""Translation table from digit characters to their values."""
+
+OFFSET_TABLES = 8
+"""Offset tables kept by offset_table(), the runner loads many grids into one process."""
+
+
+@lru_cache(maxsize=OFFSET_TABLES)
+def offset_table(
+    width: int, height: int, offsets: Offsets, wrap: bool = False
+) -> Tuple[Tuple[int, ...], ...]:
+    """Return the indices at offsets from every cell, by index.
+
+    Offsets outside of the grid are left out, or wrap around to the other side
+    if wrap is true.
+    """
+    table = []
+    for y in range(height):
+        for x in range(width):
+            indices = []
+            for offset_x, offset_y in offsets:
+                other_x, other_y = x + offset_x, y + offset_y
+                if wrap:
+                    other_x %= width
+                    other_y %= height
+
+                elif not (0 <= other_x < width and 0 <= other_y < height):
+                    continue
+
+                indices.append(other_y * width + other_x)
+
+            table.append(tuple(indices))
+
+    return tuple(table)
+
+
+class Grid:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: Optional[array.array] = None,
+        typecode: str = "b",
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.cells = cells if cells is not None else array.array(typecode, [0]) * (width * height)
+
+    @classmethod
+    def from_string(
+        cls, data: str, value: Callable[[str], int] = int, typecode: str = "b"
+    ) -> "Grid":
+        """Return a grid with one cell per character, value converts a character."""
+        lines = [line.strip() for line in data.strip().split("\n")]
+        cells = array.array(typecode, (value(char) for line in lines for char in line))
+
+        return cls(len(lines[0]), len(lines), cells)
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes, table: bytes = DIGITS, typecode: str = "b") -> "Grid":
+        """Return a grid with one cell per byte, translated by table in one pass."""
+        data = buffer[:].strip()
+        first_line_end = data.find(b"\n")
+        width = len(data[:first_line_end].rstrip(b"\r")) if first_line_end != -1 else len(data)
+
+        cells = array.array("b", data.translate(table, b"\r\n"))
+        if typecode != "b":
+            cells = array.array(typecode, cells)
+
+        return cls(width, len(cells) // width, cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Return (x, y) for index."""
+        y, x = divmod(index, self.width)
+
+        return (x, y)
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def table(self, offsets: Offsets, wrap: bool = False) -> Tuple[Tuple[int, ...], ...]:
+        return offset_table(self.width, self.height, offsets, wrap)
+
+    @property
+    def orthogonal(self) -> Tuple[Tuple[int, ...], ...]:
+        """The 4-connected neighbours, by index."""
+        return self.table(ORTHOGONAL)
+
+    @property
+    def surrounding(self) -> Tuple[Tuple[int, ...], ...]:
+        """The 8-connected neighbours, by index."""
+        return self.table(SURROUNDING)
+
+    def rows(self) -> Iterator[array.array]:
+        for start in range(0, len(self.cells), self.width):
+            yield self.cells[start : start + self.width]
+
+    def tiled(
+        self,
+        columns: int,
+        rows: int,
+        value: Callable[[int, int, int], int] = lambda value, _column, _row: value,
+    ) -> "Grid":
+        """Return a grid of columns x rows copies of this grid.
+
+        value(value, column, row) returns the value of a cell in the tile at
+        (column, row).
+        """
+        tiled_rows = (
+            array.array(
+                self.cells.typecode,
+                (value(cell, column, row) for column in range(columns) for cell in line),
+            )
+            for row in range(rows)
+            for line in self.rows()
+        )
+        cells = array.array(self.cells.typecode)
+        for line in tiled_rows:
+            cells.extend(line)
+
+        return Grid(self.width * columns, self.height * rows, cells)
+
+    def padded(self, size: int, fill: int = 0) -> "Grid":
+        """Return a copy with size cells of fill added on every side."""
+        width = self.width + 2 * size
+        border = array.array(self.cells.typecode, [fill]) * (width * size)
+        side = array.array(self.cells.typecode, [fill]) * size
+
+        cells = array.array(self.cells.typecode, border)
+        for line in self.rows():
+            cells.extend(side)
+            cells.extend(line)
+            cells.extend(side)
+
+        cells.extend(border)
+
+        return Grid(width, self.height + 2 * size, cells)
+
+    def render(self, symbol: Callable[[int], str] = str) -> str:
+        return "\n".join("".join(map(symbol, line)) for line in self.rows())
+
+    def __str__(self) -> str:
+        return self.render()
+
+
+def grid_from_dots(dots: Iterable[Tuple[int, int]], width: int, height: int) -> Grid:
+    """Return a grid with 1 for every (x, y) in dots, 0 elsewhere."""
+    grid = Grid(width, height)
+    for x, y in dots:
+        grid[y * width + x] = 1
+
+    return grid
+
+
+class TestOffsetTable(unittest.TestCase):
+    def test_corner_should_only_have_neighbours_inside_grid(self):
+        # Given
+        width, height = 3, 2
+
+        # When
+        result = offset_table(width, height, ORTHOGONAL)
+
+        # Then
+        self.assertEqual((1, 3), result[0])
+        self.assertEqual((2, 4), result[5])
+
+    def test_wrapped_window_should_include_other_side(self):
+        # Given
+        width, height = 3, 3
+
+        # When
+        result = offset_table(width, height, WINDOW, wrap=True)
+
+        # Then
+        expected = (8, 6, 7, 2, 0, 1, 5, 3, 4)
+        self.assertEqual(expected, result[0])
+
+
+class TestGrid(unittest.TestCase):
+    def test_tiled_should_repeat_rows_and_columns(self):
+        # Given
+        grid = Grid.from_string("12\n34")
+
+        # When
+        result = grid.tiled(2, 2, lambda value, column, row: value + column + 10 * row)
+
+        # Then
+        expected = "1223\n3445\n11121213\n13141415"
+        self.assertEqual(expected, str(result))
+
+    def test_from_buffer_should_translate_digits(self):
+        # Given
+        buffer = b"12\n34\n"
+
+        # When
+        result = Grid.from_buffer(buffer)
+
+        # Then
+        self.assertEqual(str(Grid.from_string("12\n34")), str(result))
+
+    def test_padded_should_surround_grid_with_fill(self):
+        # Given
+        grid = Grid.from_string("1")
+
+        # When
+        result = grid.padded(1, fill=7)
+
+        # Then
+        self.assertEqual("777\n717\n777", str(result))
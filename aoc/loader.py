@@ -0,0 +1,220 @@
+"""Zero-copy access to the puzzle input.
+
+The input is memory-mapped when stdin (or the given path) is a regular file,
+otherwise it is read into memory once. Lines and blocks are decoded lazily one
+at a time, and integers are parsed in bulk straight from the buffer:
+
+    buffer = loader.read_input()
+    for line in loader.lines(buffer):
+        ...
+"""
+
+import array
+import mmap
+import os
+import re
+import stat
+import sys
+import unittest
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+SEPARATED_CHUNK_BYTES = 16 * 1024 * 1024
+"""Bytes copied out of the buffer at a time by separated_integers()."""
+
+
+def read_input(path: Optional[str] = None) -> Buffer:
+    """Return the input from path, or stdin if path is None."""
+    if path is not None:
+        with open(path, "rb") as input_file:
+            return map_file(input_file.fileno()) or input_file.read()
+
+    try:
+        buffer = map_file(sys.stdin.fileno())
+
+    except (AttributeError, OSError, ValueError):  # i.e. io.StringIO has no file number
+        buffer = None
+
+    if buffer is None:
+        data = sys.stdin.read()
+        buffer = data.encode() if isinstance(data, str) else data
+
+    return buffer
+
+
+def map_file(file_number: int) -> Optional[mmap.mmap]:
+    """Return a read-only map of the file, None if it can't be mapped (pipes, empty files)."""
+    file_stat = os.fstat(file_number)
+    if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+        return None
+
+    return mmap.mmap(file_number, 0, access=mmap.ACCESS_READ)
+
+
+def lines(buffer: Buffer) -> Iterator[str]:
+    """Return iterator over the lines in buffer, without line endings."""
+    start = 0
+    end = len(buffer)
+    while start < end:
+        stop = buffer.find(b"\n", start)
+        if stop == -1:
+            stop = end
+
+        yield buffer[start:stop].decode().rstrip("\r")
+        start = stop + 1
+
+
+def blocks(buffer: Buffer) -> Iterator[str]:
+    """Return iterator over the blocks in buffer separated by empty lines."""
+    start = 0
+    end = len(buffer)
+    while start < end:
+        stop = buffer.find(b"\n\n", start)
+        if stop == -1:
+            stop = end
+
+        block = buffer[start:stop].decode().strip("\r\n")
+        if block:
+            yield block
+
+        start = stop + 2
+
+
+def integers(buffer: Buffer):
+    """Return all integers in buffer, whatever separates them.
+
+    The integers are parsed in bulk into an int64 numpy array, or into an
+    array.array if numpy isn't installed.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+    except ImportError:
+        return array.array("q", map(int, re.findall(rb"-?\d+", buffer)))
+
+    data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+    is_digit = numpy.zeros(len(data) + 2, dtype=numpy.int8)
+    is_digit[1:-1] = (data >= ord("0")) & (data <= ord("9"))
+
+    # Every run of digits is one number
+    edges = numpy.flatnonzero(is_digit[1:] != is_digit[:-1])
+    starts, stops = edges[0::2], edges[1::2]
+    lengths = stops - starts
+
+    # One pass per digit position counted from the end, for all numbers at once
+    values = numpy.zeros(len(starts), dtype=numpy.int64)
+    power = 1
+    for offset in range(1, int(lengths.max(initial=0)) + 1):
+        digits = data[stops - offset] - numpy.uint8(ord("0"))
+        values += numpy.where(lengths >= offset, digits, 0).astype(numpy.int64) * power
+        power *= 10
+
+    is_negative = data[numpy.maximum(starts - 1, 0)] == ord("-")
+    is_negative &= starts > 0
+    values[is_negative] *= -1
+
+    return values
+
+
+def field_count(data: bytes, separator: str) -> int:
+    """Return the number of runs of bytes in data which are neither whitespace nor separator."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    values = numpy.frombuffer(data, dtype=numpy.uint8)
+    is_separator = values <= ord(" ")
+    if not separator.isspace():
+        is_separator |= numpy.isin(values, numpy.frombuffer(separator.encode(), numpy.uint8))
+
+    starts = numpy.count_nonzero(is_separator[:-1] & ~is_separator[1:])
+
+    return int(starts) + int(len(values) > 0 and not is_separator[0])
+
+
+def separated_integers(
+    buffer: Buffer, separator: str = " ", chunk_bytes: int = SEPARATED_CHUNK_BYTES
+):
+    """Return the integers in buffer separated by separator, parsed by numpy.
+
+    A space separator matches any whitespace, i.e. one integer per line. This
+    is several times faster than integers(), but nothing except the integers
+    and the separators is allowed in buffer, ValueError is raised otherwise.
+
+    numpy only parses text out of bytes, so a mapped buffer is copied
+    chunk_bytes at a time, every chunk ending after a separator.
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    split = b"\n" if separator.isspace() else separator.encode()
+    arrays = []
+    start, end = 0, len(buffer)
+    while start < end:
+        stop = end
+        if start + chunk_bytes < end:
+            stop = buffer.rfind(split, start, start + chunk_bytes) + 1 or end
+
+        data = buffer[start:stop]
+        try:
+            values = numpy.fromstring(data, dtype=numpy.int64, sep=separator)
+
+        except ValueError:
+            values = None
+
+        # Older numpy returns the integers up to the first unparsable one
+        if values is None or len(values) != field_count(data, separator):
+            raise ValueError(f"not only integers separated by {separator!r} in {start}..{stop}")
+
+        arrays.append(values)
+        start = stop
+
+    return numpy.concatenate(arrays) if arrays else numpy.zeros(0, dtype=numpy.int64)
+
+
+class TestLines(unittest.TestCase):
+    def test_last_line_without_newline_should_be_included(self):
+        # Given
+        buffer = b"ab\ncd\r\nef"
+
+        # When
+        result = list(lines(buffer))
+
+        # Then
+        self.assertEqual(["ab", "cd", "ef"], result)
+
+    def test_blocks_should_be_split_on_empty_lines(self):
+        # Given
+        buffer = b"1,2\n\nab\ncd\n\nef\n"
+
+        # When
+        result = list(blocks(buffer))
+
+        # Then
+        self.assertEqual(["1,2", "ab\ncd", "ef"], result)
+
+
+class TestIntegers(unittest.TestCase):
+    def test_should_parse_separated_and_negative_integers(self):
+        # Given
+        buffer = b"3,-14,159\n2653\n-5"
+
+        # When
+        result = integers(buffer)
+
+        # Then
+        self.assertEqual([3, -14, 159, 2653, -5], list(result))
+
+    def test_separated_integers_should_be_chunked_and_checked(self):
+        # Given
+        buffer = b"3\n-14\n159\n2653\n-5\n"
+        malformed = [b"3\n1x4\n", b"3,,4", b"3.5 4"]
+
+        # When
+        result = separated_integers(buffer, chunk_bytes=6)
+
+        # Then
+        self.assertEqual([3, -14, 159, 2653, -5], list(result))
+        for data in malformed:
+            with self.assertRaises(ValueError):
+                separated_integers(data, "," if b"," in data else " ")
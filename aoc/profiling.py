@@ -0,0 +1,166 @@
+"""Profilers the runner can wrap around a solver.
+
+Every profiler is a context manager around a single run, and reports once the
+solver is done since the output of the solver itself is redirected:
+
+    CProfiler     deterministic profile, saved for pstats/snakeviz and the
+                  functions with the highest cumulative time reported
+    MemoryProfiler tracemalloc snapshots before and after, the lines which
+                  allocated the most memory reported
+    Sampler       statistical profile from SIGPROF, the lines most often on
+                  top of the stack reported and the collapsed stacks saved
+                  for flamegraph.pl
+"""
+
+import cProfile
+import io
+import pstats
+import signal
+import sys
+import tempfile
+import time
+import tracemalloc
+import unittest
+from collections import Counter
+from pathlib import Path
+
+
+class CProfiler:
+    def __init__(self, path: Path, top: int = 20) -> None:
+        self.path = path
+        self.top = top
+        self.profile = cProfile.Profile()
+
+    def __enter__(self) -> "CProfiler":
+        self.profile.enable()
+
+        return self
+
+    def __exit__(self, *_exception) -> None:
+        self.profile.disable()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.profile.dump_stats(self.path)
+
+    def report(self, file=sys.stdout) -> None:
+        print(f"cProfile stats saved to {self.path}", file=file)
+        stats = pstats.Stats(self.profile, stream=file)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+
+
+class MemoryProfiler:
+    def __init__(self, top: int = 20, frames: int = 1) -> None:
+        self.top = top
+        self.frames = frames
+        self.before = None
+        self.after = None
+        self.peak = 0
+
+    def __enter__(self) -> "MemoryProfiler":
+        tracemalloc.start(self.frames)
+        self.before = tracemalloc.take_snapshot()
+
+        return self
+
+    def __exit__(self, *_exception) -> None:
+        self.after = tracemalloc.take_snapshot()
+        self.peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def report(self, file=sys.stdout) -> None:
+        print(f"traced peak {self.peak / 1024 / 1024 : .1f} MiB, top allocations:", file=file)
+        differences = self.after.compare_to(self.before, "lineno")
+        for difference in differences[: self.top]:
+            print(f"  {difference}", file=file)
+
+
+class Sampler:
+    def __init__(self, path: Path, interval: float = 0.001, top: int = 20) -> None:
+        self.path = path
+        self.interval = interval
+        self.top = top
+        self.lines: Counter = Counter()
+        self.stacks: Counter = Counter()
+        self.previous = None
+
+    def sample(self, _signal_number, frame) -> None:
+        self.lines[(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)] += 1
+
+        functions = []
+        while frame is not None:
+            functions.append(f"{frame.f_code.co_name} ({Path(frame.f_code.co_filename).name})")
+            frame = frame.f_back
+
+        self.stacks[";".join(reversed(functions))] += 1
+
+    def __enter__(self) -> "Sampler":
+        self.previous = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+        return self
+
+    def __exit__(self, *_exception) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self.previous)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as stacks:
+            for stack, count in self.stacks.most_common():
+                print(stack, count, file=stacks)
+
+    def report(self, file=sys.stdout) -> None:
+        total = sum(self.lines.values())
+        print(f"{total} samples, collapsed stacks saved to {self.path}", file=file)
+        for (filename, line_number, function), count in self.lines.most_common(self.top):
+            print(
+                f"  {100 * count / total : >5.1f}% {count : >7} "
+                f"{Path(filename).name}:{line_number} ({function})",
+                file=file,
+            )
+
+
+class TestProfilers(unittest.TestCase):
+    def test_cprofiler_should_report_the_profiled_function(self):
+        # Given
+        report = io.StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = CProfiler(Path(directory) / "cprofile" / "stats.prof")
+
+            # When
+            with profiler:
+                sorted(range(1000), key=str)
+
+            profiler.report(file=report)
+            saved = profiler.path.exists()
+
+        # Then
+        self.assertTrue(saved)
+        self.assertIn("sorted", report.getvalue())
+
+    def test_memory_profiler_should_see_the_allocated_memory(self):
+        # Given
+        profiler = MemoryProfiler()
+
+        # When
+        with profiler:
+            blocks = [bytearray(1024) for _ in range(1000)]
+
+        del blocks
+
+        # Then
+        self.assertGreater(profiler.peak, 1000 * 1024)
+
+    def test_sampler_should_save_the_sampled_stacks(self):
+        # Given
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = Sampler(Path(directory) / "sampler" / "stacks.txt")
+
+            # When
+            with profiler:
+                deadline = time.monotonic() + 10
+                while not profiler.stacks and time.monotonic() < deadline:
+                    sum(range(1000))
+
+            result = profiler.path.read_text()
+
+        # Then
+        self.assertIn("test_sampler_should_save_the_sampled_stacks (profiling.py)", result)
@@ -0,0 +1,321 @@
+"""Discover the daily solutions and run them in-process.
+
+Every solution is loaded from its file, with stdin/stdout redirected, and its
+`main()` is called. Solutions without a `main()` do their work when loaded, so
+loading is always part of the measured time.
+"""
+
+import contextlib
+import importlib.util
+import io
+import resource
+import signal
+import sys
+import tempfile
+import time
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+from typing import ContextManager
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from aoc import verbosity
+from aoc.cache import AnswerCache
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ARGUMENTS: Dict[str, Callable[[Path], List[str]]] = {
+    "19a": lambda input_path: [str(input_path)],
+    "20a": lambda _input_path: ["2"],
+}
+"""Command line arguments for the solutions that read sys.argv."""
+
+@dataclass(frozen=True)
+class Solver:
+    day: str
+    part: str
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"{self.day}{self.part}"
+
+    @property
+    def sources(self) -> List[Path]:
+        """The solver file, the helper modules of its day and the modules of the aoc package."""
+        helpers = (
+            path for path in sorted(self.path.parent.glob("*.py"))
+            if not path.name.startswith("solve_")
+        )
+        shared = sorted((self.path.parent.parent / "aoc").glob("*.py"))
+
+        return [self.path, *helpers, *shared]
+
+    def input_path(self, input_name: str) -> Path:
+        return self.path.parent / input_name
+
+    def arguments(self, input_path: Optional[Path]) -> List[str]:
+        if self.name not in ARGUMENTS:
+            return []
+
+        return ARGUMENTS[self.name](input_path)
+
+
+@dataclass
+class Result:
+    solver: Solver
+    seconds: float = 0.0
+    peak_rss: int = 0
+    """Peak resident set size in KiB."""
+    answer: str = ""
+    error: Optional[str] = None
+    cached: bool = False
+    """The answer was found in the answer cache, the solver didn't run."""
+
+
+def discover(root: Path = ROOT) -> List[Solver]:
+    """Return all solvers in the tree, ordered by day and part."""
+    return [
+        Solver(day=path.parent.name, part=path.stem[-1], path=path)
+        for path in sorted(root.glob("[0-9][0-9]/solve_[ab].py"))
+    ]
+
+
+def select(solvers: Iterable[Solver], names: Iterable[str]) -> List[Solver]:
+    """Return the solvers matching any of names, i.e. "01", "1" or "15b"."""
+    wanted = [name.zfill(3) if name[-1] in "ab" else name.zfill(2) for name in names]
+    if not wanted:
+        return list(solvers)
+
+    return [
+        solver
+        for solver in solvers
+        if any(solver.name == name or solver.day == name for name in wanted)
+    ]
+
+
+def reset_peak_rss() -> None:
+    """Reset the peak RSS of this process, only possible on Linux."""
+    with contextlib.suppress(OSError):
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+
+
+def peak_rss() -> int:
+    """Return the peak RSS in KiB since the last reset_peak_rss()."""
+    with contextlib.suppress(OSError):
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+
+    # Not resettable, this is the high water mark of the entire process
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+@contextlib.contextmanager
+def day_modules(directory: Path):
+    """Make the helper modules of a day importable, and forget them afterwards.
+
+    Helper modules keep caches on module level (i.e. 24/instructions.py) so
+    they must not be shared between solvers.
+    """
+    known_modules = set(sys.modules)
+    sys.path.insert(0, str(directory))
+    try:
+        yield
+
+    finally:
+        sys.path.remove(str(directory))
+        for name in set(sys.modules) - known_modules:
+            module_file = getattr(sys.modules[name], "__file__", None) or ""
+            if Path(module_file).parent == directory:
+                del sys.modules[name]
+
+
+def load(solver: Solver):
+    """Return the freshly loaded module for solver."""
+    spec = importlib.util.spec_from_file_location(f"aoc_{solver.name}", solver.path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+class Timeout(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def time_limit(seconds: Optional[float]):
+    """Raise Timeout in the running solver after seconds, no limit if None."""
+    if seconds is None:
+        yield
+
+        return
+
+    def alarm(_signal_number, _frame):
+        raise Timeout(f"after {seconds} s")
+
+    previous = signal.signal(signal.SIGALRM, alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@contextlib.contextmanager
+def redirected(stdin, arguments: List[str]):
+    """Replace stdin, stdout, stderr and argv while running a solver.
+
+    Yields the buffer collecting stdout.
+    """
+    stdout = io.StringIO()
+    saved = (sys.stdin, sys.argv)
+    sys.stdin = stdin
+    sys.argv = arguments
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+            yield stdout
+
+    finally:
+        sys.stdin, sys.argv = saved
+
+
+def last_line(output: str) -> str:
+    """Return the last non-empty line, this is where the solutions print the answer."""
+    lines = [line for line in output.splitlines() if line.strip()]
+
+    return lines[-1].strip() if lines else ""
+
+
+def run(
+    solver: Solver,
+    input_path: Optional[Path],
+    timeout: Optional[float] = None,
+    level: int = verbosity.QUIET,
+    cache: Optional[AnswerCache] = None,
+    profiler: Optional[ContextManager] = None,
+) -> Result:
+    """Run solver with input_path as stdin, without input if input_path is None.
+
+    The solver prints with the verbosity level, by default only the answer.
+    With a cache a known answer is returned without running the solver, and
+    new answers are stored. A profiler (see aoc.profiling) is entered around
+    loading and running the solver.
+    """
+    result = Result(solver=solver)
+
+    if input_path is not None and not input_path.exists():
+        result.error = f"no {input_path.name}"
+
+        return result
+
+    if cache is not None and profiler is None:
+        key = cache.key(solver.day, solver.part, input_path, solver.sources)
+        result.answer = cache.get(key) or ""
+        if result.answer:
+            result.cached = True
+
+            return result
+
+    stdin = open(input_path) if input_path is not None else io.StringIO()
+    arguments = [str(solver.path), *solver.arguments(input_path)]
+
+    previous_level = verbosity.set_level(level)
+    reset_peak_rss()
+    start = time.perf_counter()
+    with stdin, redirected(stdin, arguments) as stdout, day_modules(solver.path.parent):
+        try:
+            with time_limit(timeout), profiler or contextlib.nullcontext():
+                module = load(solver)
+                if hasattr(module, "main"):
+                    module.main()
+
+        except Exception as error:  # pylint: disable=broad-except
+            result.error = f"{type(error).__name__}: {error}"
+
+        except SystemExit as error:
+            if error.code:
+                result.error = f"exit {error.code}"
+
+    result.seconds = time.perf_counter() - start
+    result.peak_rss = peak_rss()
+    verbosity.set_level(previous_level)
+    result.answer = last_line(stdout.getvalue())
+
+    if cache is not None and profiler is None and result.error is None and result.answer:
+        cache.put(key, result.answer)
+
+    return result
+
+
+def print_results(results: Iterable[Result], file=sys.stdout) -> None:
+    print(f"{'day' : <4} | {'seconds' : >9} | {'peak MiB' : >8} | answer", file=file)
+    print("-" * 5 + "+" + "-" * 11 + "+" + "-" * 10 + "+" + "-" * 40, file=file)
+    for result in results:
+        answer = result.answer if result.error is None else f"!! {result.error}"
+        seconds = "cached" if result.cached else f"{result.seconds:.4f}"
+        print(
+            f"{result.solver.name : <4} | {seconds : >9} | "
+            f"{result.peak_rss / 1024 : >8.1f} | {answer}",
+            file=file,
+        )
+
+
+class TestRun(unittest.TestCase):
+    def test_changed_shared_module_should_not_be_answered_from_cache(self):
+        # Given
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            (root / "aoc").mkdir()
+            (root / "01").mkdir()
+            (root / "aoc" / "loader.py").write_text("SIZE = 1\n")
+            (root / "01" / "solve_a.py").write_text("print(42)\n")
+            (solver,) = discover(root)
+            cache = AnswerCache(root / "cache")
+
+            # When
+            results = [run(solver, None, cache=cache), run(solver, None, cache=cache)]
+            (root / "aoc" / "loader.py").write_text("SIZE = 2\n")
+            results.append(run(solver, None, cache=cache))
+
+        # Then
+        result = [(result.answer, result.cached) for result in results]
+        self.assertEqual([("42", False), ("42", True), ("42", False)], result)
+
+    def test_failing_solver_should_have_error_and_last_line(self):
+        # Given
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "01" / "solve_a.py"
+            path.parent.mkdir()
+            path.write_text("def main():\n    print(1)\n    print(2)\n    raise KeyError(3)\n")
+
+            # When
+            result = run(Solver(day="01", part="a", path=path), None)
+
+        # Then
+        self.assertEqual(("2", "KeyError: 3"), (result.answer, result.error))
+
+
+class TestSelect(unittest.TestCase):
+    def test_days_and_parts_should_be_selected_by_short_names(self):
+        # Given
+        solvers = [
+            Solver(day=day, part=part, path=Path(day) / f"solve_{part}.py")
+            for day in ("01", "15")
+            for part in "ab"
+        ]
+
+        # When
+        result = [solver.name for solver in select(solvers, ["1", "15b"])]
+
+        # Then
+        self.assertEqual(["01a", "01b", "15b"], result)
@@ -0,0 +1,146 @@
+"""Run solvers in parallel worker processes, the longest ones first.
+
+The runtime of every part is remembered between runs. Starting the longest
+jobs first keeps a long job from being started last while the other workers
+sit idle, parts that have never run are assumed to be long.
+"""
+
+import concurrent.futures
+import contextlib
+import json
+import math
+import resource
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from aoc import cache
+from aoc import runner
+from aoc import verbosity
+
+HISTORY_PATH = cache.DIRECTORY / "history" / "runtimes.json"
+
+
+class History:
+    """Seconds of the last run of every part, by name."""
+
+    def __init__(self, path: Path = HISTORY_PATH) -> None:
+        self.path = path
+        self.seconds: Dict[str, float] = {}
+
+        with contextlib.suppress(OSError, ValueError):
+            with open(path) as history:
+                self.seconds = json.load(history)
+
+    def expected(self, solver: runner.Solver) -> float:
+        return self.seconds.get(solver.name, math.inf)
+
+    def update(self, results: Iterable[runner.Result]) -> None:
+        """Remember the runtimes of results, cached answers say nothing about them."""
+        self.seconds.update(
+            (result.solver.name, result.seconds) for result in results if not result.cached
+        )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as history:
+            json.dump(self.seconds, history, indent=2, sort_keys=True)
+
+
+def schedule(solvers: Iterable[runner.Solver], history: History) -> List[runner.Solver]:
+    """Return solvers ordered by expected runtime, longest first."""
+    return sorted(solvers, key=history.expected, reverse=True)
+
+
+def run_limited(
+    solver: runner.Solver,
+    input_path: Optional[Path],
+    memory_limit: Optional[int] = None,
+    **kwargs,
+) -> runner.Result:
+    """Run solver in a worker with its address space limited to memory_limit bytes.
+
+    The limit stays with the worker process, which is never shared with the
+    runner itself. Exceeding it ends the solver with a MemoryError.
+    """
+    if memory_limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    return runner.run(solver, input_path, **kwargs)
+
+
+def run_parallel(
+    solvers: List[runner.Solver],
+    input_name: str,
+    jobs: int,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    level: int = verbosity.QUIET,
+    answer_cache: Optional[cache.AnswerCache] = None,
+    history: Optional[History] = None,
+) -> List[runner.Result]:
+    """Run solvers in jobs worker processes and return the results in the order of solvers."""
+    history = history if history is not None else History()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            solver: executor.submit(
+                run_limited,
+                solver,
+                solver.input_path(input_name),
+                memory_limit,
+                timeout=timeout,
+                level=level,
+                cache=answer_cache,
+            )
+            for solver in schedule(solvers, history)
+        }
+
+        results = []
+        for solver in solvers:
+            try:
+                results.append(futures[solver].result())
+
+            except concurrent.futures.process.BrokenProcessPool as error:
+                # The worker died, i.e. killed by the OOM killer
+                results.append(runner.Result(solver=solver, error=f"worker died: {error}"))
+
+    return results
+
+
+def print_summary(results: List[runner.Result], wall_seconds: float, file=sys.stdout) -> None:
+    """Print the results table followed by the total and the parallel speedup."""
+    runner.print_results(results, file=file)
+
+    total = sum(result.seconds for result in results)
+    failed = sum(1 for result in results if result.error is not None)
+    cached = sum(1 for result in results if result.cached)
+    print(
+        f"\n{len(results)} parts, {failed} failed, {cached} cached | "
+        f"wall {wall_seconds:.2f} s | sum {total:.2f} s | "
+        f"speedup {total / wall_seconds if wall_seconds else 0:.1f}x",
+        file=file,
+    )
+
+
+class TestSchedule(unittest.TestCase):
+    def test_longest_and_unknown_parts_should_run_first(self):
+        # Given
+        solvers = [
+            runner.Solver(day=day, part="a", path=Path(day) / "solve_a.py")
+            for day in ("01", "02", "03")
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            history = History(Path(directory) / "runtimes.json")
+            history.update([runner.Result(solver=solvers[0], seconds=0.5)])
+            history.update([runner.Result(solver=solvers[2], seconds=2.0)])
+
+            # When
+            result = schedule(solvers, History(history.path))
+
+        # Then
+        self.assertEqual(["02a", "03a", "01a"], [solver.name for solver in result])
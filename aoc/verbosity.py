@@ -0,0 +1,174 @@
+"""Output verbosity shared by all days.
+
+The answer is always printed with a plain `print()`, everything else goes
+through `info()` or `trace()` and is only formatted when its level is enabled:
+
+    QUIET  only the answer
+    INFO   the default, summaries and progress
+    TRACE  everything, including output from inner loops
+
+The standalone scripts take `--quiet` or `--trace` on the command line, the
+level can also be set with the environment variable AOC_VERBOSITY, by name
+or by number.
+"""
+
+import os
+import sys
+import unittest
+import unittest.mock
+from typing import List
+from typing import Optional
+
+QUIET = 0
+INFO = 1
+TRACE = 2
+
+LEVELS = {
+    "quiet": QUIET,
+    "info": INFO,
+    "trace": TRACE,
+}
+
+FLAGS = {
+    "--quiet": QUIET,
+    "--trace": TRACE,
+}
+
+
+def parse_level(value: Optional[str], default: int = INFO) -> int:
+    """Return the level named or numbered by value, default if value is unset or no level."""
+    if value is None or not value.strip():
+        return default
+
+    value = value.strip().lower()
+    if value in LEVELS:
+        return LEVELS[value]
+
+    try:
+        return int(value)
+
+    except ValueError:
+        print(
+            f"AOC_VERBOSITY={value!r} is not one of {', '.join(LEVELS)} or a number, "
+            f"using {default}",
+            file=sys.stderr,
+        )
+
+        return default
+
+
+LEVEL = parse_level(os.environ.get("AOC_VERBOSITY"))
+
+
+def set_level(level: int) -> int:
+    """Set the verbosity level and return the previous one."""
+    global LEVEL  # pylint: disable=global-statement
+
+    previous, LEVEL = LEVEL, level
+
+    return previous
+
+
+def enabled(level: int) -> bool:
+    return LEVEL >= level
+
+
+def info(*values, **kwargs) -> None:
+    """Print values like `print()`, but only if INFO is enabled."""
+    if LEVEL >= INFO:
+        print(*values, **kwargs)
+
+
+def trace(*values, **kwargs) -> None:
+    """Print values like `print()`, but only if TRACE is enabled."""
+    if LEVEL >= TRACE:
+        print(*values, **kwargs)
+
+
+class NoProgress:
+    """Stands in for a tqdm progress bar when it isn't shown."""
+
+    def __enter__(self) -> "NoProgress":
+        return self
+
+    def __exit__(self, *_exception) -> None:
+        pass
+
+    def update(self, _count: int = 1) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def progress(description: str, total: int):
+    """Return a tqdm progress bar if INFO is enabled and tqdm is installed.
+
+    tqdm is only imported when the bar is shown, it is slow to import.
+    """
+    if LEVEL < INFO:
+        return NoProgress()
+
+    try:
+        from tqdm import tqdm  # pylint: disable=import-outside-toplevel
+
+    except ImportError:
+        return NoProgress()
+
+    return tqdm(desc=description, total=total)
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> None:
+    """Set the level from --quiet/--trace and remove them from arguments.
+
+    The arguments default to sys.argv, the remaining arguments are left for
+    the solution, i.e. sys.argv[1].
+    """
+    if arguments is None:
+        arguments = sys.argv
+
+    for flag, level in FLAGS.items():
+        while flag in arguments:
+            arguments.remove(flag)
+            set_level(level)
+
+
+class TestParseLevel(unittest.TestCase):
+    def test_names_and_numbers_should_be_levels(self):
+        # Given
+        values = ["quiet", " TRACE ", "1", None, ""]
+
+        # When
+        result = [parse_level(value) for value in values]
+
+        # Then
+        self.assertEqual([QUIET, TRACE, INFO, INFO, INFO], result)
+
+    def test_unknown_value_should_fall_back_to_default(self):
+        # Given
+        value = "loud"
+
+        # When
+        with unittest.mock.patch("sys.stderr"):
+            result = parse_level(value, default=QUIET)
+
+        # Then
+        self.assertEqual(QUIET, result)
+
+
+class TestParseArguments(unittest.TestCase):
+    def test_flags_should_set_level_and_be_removed(self):
+        # Given
+        arguments = ["solve_a.py", "--trace", "256"]
+        previous = LEVEL
+
+        # When
+        try:
+            parse_arguments(arguments)
+            result = arguments, LEVEL
+
+        finally:
+            set_level(previous)
+
+        # Then
+        self.assertEqual((["solve_a.py", "256"], TRACE), result)